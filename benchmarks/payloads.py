@@ -0,0 +1,177 @@
+from typing import List
+
+from itertools import count
+from time import time
+
+from discord.utils import DISCORD_EPOCH
+
+
+__all__ = (
+    "snowflake",
+    "button_layout",
+    "select_layout",
+    "message_payload",
+    "interaction_payload",
+    "PAYLOAD_KINDS",
+)
+
+
+_sequence = count()
+
+GUILD_ID = "859000000000000000"
+CHANNEL_ID = "859000000000000001"
+BOT_ID = "859000000000000002"
+USER_ID = "859000000000000003"
+
+
+def snowflake(timestamp: float = None) -> str:
+    timestamp = time() if timestamp is None else timestamp
+    return str(
+        (int(timestamp * 1000) - DISCORD_EPOCH) << 22 | (next(_sequence) & 0x3FFFFF)
+    )
+
+
+def _user(user_id: str, *, bot: bool = False) -> dict:
+    return {
+        "id": user_id,
+        "username": "bot" if bot else "user",
+        "discriminator": "0001",
+        "avatar": "a" * 32,
+        "public_flags": 0,
+        **({"bot": True} if bot else {}),
+    }
+
+
+def button_layout(rows: int = 5, columns: int = 5, prefix: str = "button") -> List[dict]:
+    return [
+        {
+            "type": 1,
+            "components": [
+                {
+                    "type": 2,
+                    "style": 1 + (row + column) % 4,
+                    "label": f"Button {row}-{column}",
+                    "emoji": {"id": None, "name": "🔥"},
+                    "custom_id": f"{prefix}:{row}:{column}",
+                    "disabled": False,
+                }
+                for column in range(columns)
+            ],
+        }
+        for row in range(rows)
+    ]
+
+
+def select_layout(options: int = 25, custom_id: str = "select") -> List[dict]:
+    return [
+        {
+            "type": 1,
+            "components": [
+                {
+                    "type": 3,
+                    "custom_id": custom_id,
+                    "placeholder": "Pick some options",
+                    "min_values": 1,
+                    "max_values": options,
+                    "options": [
+                        {
+                            "label": f"Option {i}",
+                            "value": f"value-{i}",
+                            "description": f"The option number {i}",
+                            "emoji": {"id": None, "name": "⭐"},
+                            "default": False,
+                        }
+                        for i in range(options)
+                    ],
+                    "disabled": False,
+                }
+            ],
+        }
+    ]
+
+
+def message_payload(components: List[dict], *, guild: bool = True) -> dict:
+    message_id = snowflake()
+    data = {
+        "id": message_id,
+        "channel_id": CHANNEL_ID,
+        "author": _user(BOT_ID, bot=True),
+        "content": "Pick one of the components below.",
+        "timestamp": "2021-07-01T00:00:00.000000+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [
+            {
+                "type": "rich",
+                "title": "Benchmark",
+                "description": "A synthetic message used by the benchmark suite.",
+                "color": 0x5865F2,
+                "fields": [{"name": f"Field {i}", "value": "x" * 32} for i in range(5)],
+            }
+        ],
+        "pinned": False,
+        "type": 0,
+        "flags": 0,
+        "components": components,
+    }
+    if guild:
+        data["guild_id"] = GUILD_ID
+    return data
+
+
+def interaction_payload(
+    components: List[dict],
+    custom_id: str,
+    *,
+    guild: bool = True,
+    component_type: int = 2,
+    values: List[str] = None,
+) -> dict:
+    data = {
+        "id": snowflake(),
+        "application_id": BOT_ID,
+        "type": 3,
+        "token": "t" * 180,
+        "version": 1,
+        "channel_id": CHANNEL_ID,
+        "data": {"custom_id": custom_id, "component_type": component_type},
+        "message": message_payload(components, guild=guild),
+    }
+    if values is not None:
+        data["data"]["values"] = values
+
+    if guild:
+        data["guild_id"] = GUILD_ID
+        data["member"] = {
+            "user": _user(USER_ID),
+            "roles": [],
+            "nick": None,
+            "avatar": None,
+            "premium_since": None,
+            "joined_at": "2021-07-01T00:00:00.000000+00:00",
+            "is_pending": False,
+            "pending": False,
+            "permissions": "2147483647",
+            "mute": False,
+            "deaf": False,
+        }
+    else:
+        data["user"] = _user(USER_ID)
+
+    return {"t": "INTERACTION_CREATE", "s": next(_sequence), "op": 0, "d": data}
+
+
+PAYLOAD_KINDS = {
+    "guild-button-5x5": lambda: interaction_payload(button_layout(), "button:2:2"),
+    "dm-button-5x5": lambda: interaction_payload(button_layout(), "button:2:2", guild=False),
+    "guild-select-25": lambda: interaction_payload(
+        select_layout(), "select", component_type=3, values=["value-0", "value-24"]
+    ),
+    "dm-select-25": lambda: interaction_payload(
+        select_layout(), "select", guild=False, component_type=3, values=["value-3"]
+    ),
+}
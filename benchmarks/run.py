@@ -0,0 +1,334 @@
+from typing import Awaitable, Callable, List, NamedTuple
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from io import BytesIO
+from itertools import count
+from time import perf_counter
+
+import discord
+from discord import File, Object
+
+from discord_components import (
+    ActionRow,
+    Button,
+    CallbackRegistry,
+    DiscordComponents,
+    Interaction,
+    Select,
+    SelectOption,
+)
+from discord_components.dpy_overrides import ComponentMessage
+from discord_components.utils import _form_files, _get_components_json
+
+from .payloads import BOT_ID, CHANNEL_ID, PAYLOAD_KINDS, button_layout, snowflake
+
+
+class Result(NamedTuple):
+    name: str
+    number: int
+    seconds: float
+    peak: int
+
+    def __str__(self) -> str:
+        per_op = self.seconds / self.number
+        return (
+            f"{self.name:<48} {1 / per_op:>14,.0f} ops/s {per_op * 1e6:>10.2f} us/op"
+            f" {self.peak:>12,} B peak"
+        )
+
+
+def _measure(name: str, func: Callable[[], None], number: int, repeat: int = 3) -> Result:
+    func()
+    gc.collect()
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return Result(name, number, best, peak)
+
+
+async def _ameasure(
+    name: str, func: Callable[[], Awaitable], number: int, repeat: int = 3, after=None
+) -> Result:
+    await func()
+    gc.collect()
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            await func()
+        best = min(best, perf_counter() - start)
+        if after is not None:
+            await after()
+
+    tracemalloc.start()
+    await func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if after is not None:
+        await after()
+    return Result(name, number, best, peak)
+
+
+def _make_client() -> discord.Client:
+    async def request(route, **kwargs):
+        return {}
+
+    client = discord.Client(intents=discord.Intents.none())
+    client.http.request = request
+    client._connection.user = Object(id=int(BOT_ID))
+    return client
+
+
+def _button_rows(rows: int = 5, columns: int = 5) -> List[ActionRow]:
+    return [
+        ActionRow(
+            *(
+                Button(label=f"Button {row}-{column}", emoji="🔥", custom_id=f"b:{row}:{column}")
+                for column in range(columns)
+            )
+        )
+        for row in range(rows)
+    ]
+
+
+def _select_rows(options: int = 25) -> List[ActionRow]:
+    return [
+        ActionRow(
+            Select(
+                custom_id="select",
+                placeholder="Pick some options",
+                max_values=options,
+                options=[
+                    SelectOption(
+                        label=f"Option {i}",
+                        value=f"value-{i}",
+                        description=f"The option number {i}",
+                        emoji="⭐",
+                    )
+                    for i in range(options)
+                ],
+            )
+        )
+    ]
+
+
+async def bench_routing(client: discord.Client, number: int) -> List[Result]:
+    components = DiscordComponents(client)
+
+    async def callback(interaction: Interaction):
+        pass
+
+    for row in button_layout():
+        for button in row["components"]:
+            components.add_callback(Button(label="x", custom_id=button["custom_id"]), callback)
+
+    async def route_callback(interaction: Interaction, row: int, column: int):
+        pass
+
+    components.add_route("route:{row:int}:{column:int}", route_callback)
+
+    async def drain():
+        while components.scheduler.in_flight:
+            await asyncio.gather(*components.scheduler._tasks)
+
+    results = []
+    cases = {
+        "registry hit": PAYLOAD_KINDS["guild-button-5x5"](),
+        "router hit": PAYLOAD_KINDS["guild-button-5x5"](),
+        "miss": PAYLOAD_KINDS["guild-select-25"](),
+    }
+    cases["router hit"]["d"]["data"]["custom_id"] = "route:2:2"
+
+    ids = count(int(snowflake()))
+    for case, payload in cases.items():
+        data = payload["d"]
+
+        async def dispatch():
+            data["id"] = str(next(ids))
+            await components.on_socket_response(payload)
+
+        results.append(
+            await _ameasure(f"on_socket_response ({case})", dispatch, number, after=drain)
+        )
+    return results
+
+
+def bench_parsing(client: discord.Client, number: int) -> List[Result]:
+    state = client._connection
+    components = DiscordComponents(client)
+    channel = Object(id=int(CHANNEL_ID))
+
+    results = []
+    for kind, factory in PAYLOAD_KINDS.items():
+        data = factory()["d"]
+        results.append(
+            _measure(
+                f"Interaction.__init__ ({kind})",
+                lambda: Interaction(state=state, client=components, raw_data=data),
+                number,
+            )
+        )
+
+    for kind in ("guild-button-5x5", "guild-select-25"):
+        message = PAYLOAD_KINDS[kind]()["d"]["message"]
+        for views in (False, True):
+            state._component_views = views
+            results.append(
+                _measure(
+                    f"ComponentMessage ({kind}{', views' if views else ''})",
+                    lambda: ComponentMessage(state=state, channel=channel, data=message),
+                    number // 4,
+                )
+            )
+    state._component_views = False
+    return results
+
+
+def bench_serialization(number: int) -> List[Result]:
+    results = []
+    for kind, factory in (("buttons 5x5", _button_rows), ("select 25", _select_rows)):
+        layouts = iter([factory() for _ in range(number * 4 + 2)])
+        results.append(
+            _measure(
+                f"_get_components_json ({kind}, cold)",
+                lambda: _get_components_json(next(layouts)),
+                number,
+            )
+        )
+
+        layout = factory()
+        results.append(
+            _measure(
+                f"_get_components_json ({kind}, memoized)",
+                lambda: _get_components_json(layout),
+                number * 10,
+            )
+        )
+
+        rows = iter([factory() for _ in range(number * 4 + 2)])
+        results.append(
+            _measure(
+                f"ActionRow.to_dict ({kind}, cold)",
+                lambda: [row.to_dict() for row in next(rows)],
+                number,
+            )
+        )
+    return results
+
+
+async def bench_files(number: int) -> List[Result]:
+    class Sink:
+        def __init__(self):
+            self.size = 0
+
+        async def write(self, chunk):
+            self.size += len(chunk)
+
+    data = {"content": "files", "components": button_layout()}
+    results = []
+    for n_files, size in ((1, 1 << 10), (3, 1 << 16), (10, 1 << 20)):
+        buffers = [BytesIO(b"x" * size) for _ in range(n_files)]
+
+        def build():
+            files = []
+            for i, buffer in enumerate(buffers):
+                buffer.seek(0)
+                files.append(File(buffer, f"file{i}.bin"))
+            return _form_files(data, files)
+
+        results.append(_measure(f"_form_files ({n_files} x {size >> 10} KiB)", build, number))
+
+        async def write():
+            await build().write(Sink())
+
+        results.append(
+            await _ameasure(
+                f"_form_files + write ({n_files} x {size >> 10} KiB)", write, number // 10 or 1
+            )
+        )
+    return results
+
+
+def bench_registry(sizes: List[int]) -> List[str]:
+    async def callback(interaction: Interaction):
+        pass
+
+    lines = []
+    for size in sizes:
+        gc.collect()
+        tracemalloc.start()
+        registry = CallbackRegistry()
+        for i in range(size):
+            registry.add(f"custom-id-{i}", callback)
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        keys = [f"custom-id-{i}" for i in range(0, size, max(size // 10000, 1))]
+        start = perf_counter()
+        for key in keys:
+            registry.get(key)
+        elapsed = perf_counter() - start
+
+        lines.append(
+            f"{'CallbackRegistry (' + format(size, ',') + ' callbacks)':<48}"
+            f" {current / (1 << 20):>10.1f} MiB {current / size:>8.0f} B/callback"
+            f" {len(keys) / elapsed:>14,.0f} get/s"
+        )
+        del registry
+    return lines
+
+
+async def main(args: argparse.Namespace):
+    number = 1000 if args.quick else 10000
+    sizes = [size for size in (10000, 100000, 1000000) if size <= args.max_callbacks]
+    client = _make_client()
+
+    groups = {
+        "routing": lambda: bench_routing(client, number),
+        "parsing": lambda: bench_parsing(client, number),
+        "serialization": lambda: bench_serialization(number // 10),
+        "files": lambda: bench_files(number // 10),
+        "registry": lambda: bench_registry(sizes),
+    }
+    for name, group in groups.items():
+        if args.only and name not in args.only:
+            continue
+
+        print(f"== {name}")
+        results = group()
+        if asyncio.iscoroutine(results):
+            results = await results
+        for result in results:
+            print(result)
+        print()
+
+    await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmarks for discord_components.")
+    parser.add_argument("--quick", action="store_true", help="run fewer iterations")
+    parser.add_argument(
+        "--only",
+        nargs="*",
+        choices=("routing", "parsing", "serialization", "files", "registry"),
+        help="run only the given groups",
+    )
+    parser.add_argument(
+        "--max-callbacks",
+        type=int,
+        default=1000000,
+        help="largest registry size to measure (10k, 100k and 1M are tried)",
+    )
+    asyncio.run(main(parser.parse_args()))
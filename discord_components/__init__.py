@@ -3,3 +3,19 @@ from .interaction import *
 from .component import *
 from .dpy_overrides import *
 from .http import *
+from .registry import *
+from .router import *
+from .waiters import *
+from .scheduler import *
+from .deadline import *
+from .persistence import *
+from .offload import *
+from .coalesce import *
+from .file import *
+from .encoder import *
+from .template import *
+from .codec import *
+from .dedup import *
+from .shedding import *
+from .metrics import *
+from .tracing import *
@@ -1,10 +1,18 @@
-from typing import Union
+from typing import Union, Callable
+from collections import OrderedDict
+from datetime import datetime
+from asyncio import ensure_future, get_event_loop, wait_for
+from time import perf_counter, time
+from functools import partial, update_wrapper
+from concurrent.futures import Executor, ProcessPoolExecutor
+from enum import IntFlag
 
 from discord import (
     Client,
     Message,
     User,
     Guild,
+    HTTPException,
 )
 from discord.ext.commands import Bot
 from discord.abc import Messageable
@@ -12,31 +20,157 @@ from discord.abc import Messageable
 from .component import Component
 from .http import HTTPClient
 from .interaction import Interaction, InteractionEventType
+from .registry import CallbackRegistry
+from .router import ComponentRouter
+from .waiters import WaiterTable
+from .scheduler import CallbackScheduler
+from .deadline import DeadlineGuard
+from .persistence import PersistentCallbackStore
+from .offload import _offload_callback
+from .coalesce import EditCoalescer
+from .codec import CustomIdCodec
+from .dedup import InteractionDeduplicator
+from .shedding import LoadShedder, ShedAction
+from .metrics import Metrics
+from .tracing import Tracer, _span
 
 from .ext.filters import *
 
-__all__ = ("DiscordComponents", "ComponentsClient", "ComponentsBot")
+__all__ = ("DiscordComponents", "ComponentsClient", "ComponentsBot", "EventEmission")
+
+
+class EventEmission(IntFlag):
+    none = 0
+    typed = 1
+    raw = 2
+    all = 3
+
+
+_EVENT_NAMES = {_type.value: (_type.name, f"raw_{_type.name}") for _type in InteractionEventType}
+_PERSISTENT_MISS_CACHE_SIZE = 10000
+_LISTENER_NAMES = {
+    event: f"on_{event}"
+    for event in ("interaction", "raw_interaction", *sum(_EVENT_NAMES.values(), ()))
+}
 
 
 class DiscordComponents:
     def __init__(
         self,
         bot: Union[Bot, Client],
+        *,
+        component_views: bool = False,
+        callback_max_size: int = None,
+        on_callback_evict: Callable[[str, dict, str], None] = None,
+        events: EventEmission = EventEmission.all,
+        max_concurrency: int = None,
+        drain_timeout: float = 10.0,
+        deadline_guard: DeadlineGuard = None,
+        persistent_store: PersistentCallbackStore = None,
+        process_workers: int = None,
+        coalesce_window: float = None,
+        custom_id_codec: CustomIdCodec = None,
+        dedup_size: int = 4096,
+        load_shedder: LoadShedder = None,
+        metrics: Metrics = None,
+        tracer: Tracer = None,
     ):
         self.bot = bot
         bot.components_manager = self
+        bot._connection._component_views = component_views
+
+        self.events = events
 
-        self.http = HTTPClient(bot=bot)
-        self._components_callback = {}
+        self.metrics = metrics
+        self.tracer = tracer
+        self.http = HTTPClient(bot=bot, metrics=metrics, tracer=tracer)
+        self._components_callback = CallbackRegistry(
+            max_size=callback_max_size, on_evict=on_callback_evict
+        )
+        self.router = ComponentRouter()
+        self.custom_id_codec = custom_id_codec
+        self.deduplicator = InteractionDeduplicator(dedup_size) if dedup_size else None
+        self.load_shedder = load_shedder
+        self._waiters = WaiterTable()
+        self.scheduler = CallbackScheduler(max_concurrency=max_concurrency)
+        self.drain_timeout = drain_timeout
+        self.deadline_guard = deadline_guard
+        self.persistent_store = persistent_store
+        self._persistent_handlers = {}
+        self._persistent_misses: "OrderedDict[str, None]" = OrderedDict()
+        self.process_workers = process_workers
+        self._process_pool = None
+        self.edit_coalescer = (
+            EditCoalescer(window=coalesce_window, on_error=self._on_coalesced_edit_error)
+            if coalesce_window is not None
+            else None
+        )
+        if metrics is not None:
+            self._register_metrics(metrics)
 
         if isinstance(self.bot, Bot):
             self.bot.add_listener(self.on_socket_response, name="on_socket_response")
         else:
             self.bot.on_socket_response = self.on_socket_response
 
+        close = self.bot.close
+
+        async def close_override():
+            if self.load_shedder is not None:
+                self.load_shedder.stop()
+            await self.scheduler.drain(timeout=self.drain_timeout)
+            if self.edit_coalescer is not None:
+                await self.edit_coalescer.flush_all()
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False)
+            if self.persistent_store is not None:
+                await get_event_loop().run_in_executor(None, self.persistent_store.close)
+            await close()
+
+        self.bot.close = close_override
+
+    def _register_metrics(self, metrics: Metrics):
+        metrics.gauge("registered_callbacks", lambda: len(self._components_callback))
+        metrics.gauge("callbacks_in_flight", lambda: self.scheduler.in_flight)
+        if self.persistent_store is not None:
+            metrics.gauge("persistent_callbacks", lambda: len(self.persistent_store))
+        if self.deduplicator is not None:
+            metrics.counter("duplicates_dropped_total", lambda: self.deduplicator.dropped)
+        if self.load_shedder is not None:
+            metrics.counter("interactions_shed_total", lambda: self.load_shedder.shed)
+            metrics.gauge("event_loop_lag_seconds", lambda: self.load_shedder.lag)
+        if self.deadline_guard is not None:
+            metrics.counter("deadline_deferred_total", lambda: self.deadline_guard.deferred_count)
+
     async def on_socket_response(self, res):
         if (res["t"] != "INTERACTION_CREATE") or (res["d"]["type"] != 3):
             return
+        if self.tracer is not None and self.tracer.sample():
+            with self.tracer.span(
+                "interaction.receive",
+                {"interaction.id": res["d"]["id"], "custom_id": res["d"]["data"]["custom_id"]},
+            ):
+                self._receive(res)
+        else:
+            self._receive(res)
+
+    def _receive(self, res):
+        if self.metrics is None:
+            self._on_interaction_create(res)
+            return
+
+        start = perf_counter()
+        try:
+            self._on_interaction_create(res)
+        finally:
+            self.metrics.inc("interactions_total")
+            self.metrics.observe("routing_seconds", perf_counter() - start)
+
+    def _on_interaction_create(self, res):
+        if self.deduplicator is not None and self.deduplicator.seen(res["d"]["id"]):
+            return
+        if self.load_shedder is not None and self._shed(res["d"]):
+            return
 
         if res["d"]["message"].get("message_reference") and not res["d"]["message"][
             "message_reference"
@@ -44,34 +178,137 @@ class DiscordComponents:
             res["d"]["message"]["message_reference"] = res["d"]["channel_id"]
 
         interaction = self._get_interaction(res)
-        self.bot.dispatch(f"raw_interaction", res["d"])
-        self.bot.dispatch("interaction", interaction)
+        self._dispatch("interaction", "raw_interaction", interaction, res["d"])
 
-        if self._components_callback.get(interaction.custom_id):
-            callback_info = self._components_callback[interaction.custom_id]
-            if callback_info["uses"] == 0:
-                del self._components_callback[interaction.custom_id]
+        callback_info = self._components_callback.get(interaction.custom_id)
+        if callback_info is not None:
+            if not self._run_registered(interaction, callback_info):
                 return
+        elif self.custom_id_codec is not None and self.custom_id_codec.matches(
+            interaction.custom_id
+        ):
+            decoded = self.custom_id_codec.decode(interaction.custom_id)
+            if decoded is not None:
+                name, callback, params = decoded
+                self._schedule(interaction, callback, params, key=name)
+        else:
+            matched = self.router.match(interaction.custom_id)
+            if matched is not None:
+                route, params = matched
+                with _span(self.tracer, "interaction.filter"):
+                    allowed = route.filter(interaction)
+                if not allowed:
+                    return
 
-            if callback_info["uses"] is not None:
-                self._components_callback[interaction.custom_id]["uses"] -= 1
-            if not callback_info["filter"](interaction):
-                return
+                self._schedule(interaction, route.callback, params, key=route.pattern)
+            elif (
+                self.persistent_store is not None
+                and interaction.custom_id not in self._persistent_misses
+            ):
+                ensure_future(self._rehydrate_callback(interaction))
 
-            await self._components_callback[interaction.custom_id]["callback"](interaction)
+        event_names = _EVENT_NAMES.get(interaction.component_type)
+        if event_names is not None:
+            self._dispatch(*event_names, interaction, res["d"])
 
-        for _type in InteractionEventType:
-            if _type.value == res["d"]["data"]["component_type"]:
-                self.bot.dispatch(f"raw_{_type.name}", res["d"])
-                self.bot.dispatch(_type.name, interaction)
-                break
+    def _run_registered(self, interaction: Interaction, callback_info: dict) -> bool:
+        with _span(self.tracer, "interaction.filter"):
+            allowed = callback_info["filter"](interaction)
+        if not allowed:
+            return False
 
-    def _get_interaction(self, json: dict):
-        ctx = Interaction(
-            state=self.bot._connection,
-            client=self,
-            raw_data=json["d"],
+        self._components_callback.use(interaction.custom_id)
+        if callback_info.get("persistent"):
+            self.persistent_store.submit(self.persistent_store.use, interaction.custom_id)
+
+        callback = callback_info["callback"]
+        self._schedule(
+            interaction, callback, key=getattr(callback, "__qualname__", interaction.custom_id)
+        )
+        return True
+
+    def _shed(self, data: dict) -> bool:
+        action = self.load_shedder.check(data["data"]["custom_id"], self.scheduler.in_flight)
+        if action is None:
+            return False
+
+        if action == ShedAction.respond:
+            ensure_future(self._send_shed_response(data))
+        return True
+
+    async def _send_shed_response(self, data: dict):
+        try:
+            await self.http.initial_response(
+                interaction_id=data["id"],
+                interaction_token=data["token"],
+                data={"type": 4, "data": self.load_shedder.response},
+            )
+        except HTTPException:
+            pass
+
+    def _schedule(self, interaction: Interaction, callback, params: dict = None, *, key: str):
+        handle = None
+        if self.deadline_guard is not None:
+            handle = self.deadline_guard.watch(interaction, key)
+
+        task = self.scheduler.schedule(
+            interaction.message_id,
+            self._run_callback,
+            interaction,
+            callback,
+            params or {},
+            key,
+            handle,
+        )
+        if task is None and handle is not None:
+            handle.cancel()
+
+    async def _on_coalesced_edit_error(self, target):
+        await self.bot.on_error("on_coalesced_edit", target)
+
+    async def _run_callback(
+        self, interaction: Interaction, callback, params: dict, key: str, handle=None
+    ):
+        start = perf_counter()
+        try:
+            with _span(self.tracer, "interaction.callback", {"handler": key}):
+                await callback(interaction, **params)
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.inc("callback_errors_total", handler=key)
+            await self.bot.on_error("on_component_callback", interaction)
+        finally:
+            if handle is not None:
+                handle.cancel()
+            elapsed = perf_counter() - start
+            if self.deadline_guard is not None:
+                self.deadline_guard.record(key, elapsed)
+            if self.metrics is not None:
+                self.metrics.observe("callback_seconds", elapsed, handler=key)
+
+    def _dispatch(self, event: str, raw_event: str, interaction: Interaction, data: dict):
+        if self.events & EventEmission.raw and self._has_listener(raw_event):
+            self.bot.dispatch(raw_event, data)
+        if self.events & EventEmission.typed and self._has_listener(event):
+            self.bot.dispatch(event, interaction)
+        self._waiters.resolve(event, interaction)
+
+    def _has_listener(self, event: str) -> bool:
+        bot = self.bot
+        listener = _LISTENER_NAMES[event]
+        return (
+            hasattr(bot, listener)
+            or event in bot._listeners
+            or bool(getattr(bot, "extra_events", {}).get(listener))
         )
+
+    def _get_interaction(self, json: dict):
+        with _span(self.tracer, "interaction.construct"):
+            ctx = Interaction(
+                state=self.bot._connection,
+                client=self,
+                raw_data=json["d"],
+            )
         return ctx
 
     async def wait_for(
@@ -86,6 +323,18 @@ class DiscordComponents:
         user: User = None,
         timeout: float = None,
     ):
+        if event == "interaction" or event in InteractionEventType.__members__:
+            return await self._wait_for_interaction(
+                event,
+                message=message,
+                component=component,
+                ephemeral=ephemeral,
+                guild=guild,
+                channel=channel,
+                user=user,
+                timeout=timeout,
+            )
+
         check_list = []
         if message is not None:
             check_list.append(message_filter(message, ephemeral))
@@ -106,14 +355,175 @@ class DiscordComponents:
 
         return await self.bot.wait_for(event, check=check, timeout=timeout)
 
-    def add_callback(self, component: Component, callback, *, uses: int = None, filter=None):
-        self._components_callback[component.custom_id] = {
-            "callback": callback,
-            "uses": uses,
-            "filter": filter or (lambda x: True),
-        }
+    async def _wait_for_interaction(
+        self,
+        event: str,
+        *,
+        message: Message = None,
+        component: Component = None,
+        ephemeral: bool = False,
+        guild: Guild = None,
+        channel: Messageable = None,
+        user: User = None,
+        timeout: float = None,
+    ):
+        check_list = []
+        if message is not None and ephemeral:
+            check_list.append(message_filter(message, ephemeral))
+        if guild is not None:
+            check_list.append(guild_filter(guild))
+        if channel is not None:
+            check_list.append(channel_filter(channel))
+
+        def check(interaction: Interaction):
+            for i in check_list:
+                if not i(interaction):
+                    return False
+            return True
+
+        waiter = self._waiters.add(
+            event,
+            message_id=message.id if message is not None else None,
+            custom_id=component.id if component is not None else None,
+            user_id=user.id if user is not None else None,
+            check=check if check_list else None,
+        )
+        try:
+            return await wait_for(waiter.future, timeout=timeout)
+        finally:
+            self._waiters.remove(waiter)
+
+    def add_callback(
+        self,
+        component: Component,
+        callback,
+        *,
+        uses: int = None,
+        filter=None,
+        timeout: float = None,
+        expires_at: Union[float, datetime] = None,
+        executor: Union[str, Executor] = None,
+    ):
+        if executor == "process":
+            callback = _offload_callback(callback, self._get_process_pool)
+        elif isinstance(executor, Executor):
+            callback = _offload_callback(callback, lambda: executor)
+        elif executor is not None:
+            raise ValueError('executor must be "process" or a concurrent.futures.Executor.')
+
+        self._components_callback.add(
+            component.custom_id,
+            callback,
+            uses=uses,
+            filter=filter,
+            timeout=timeout,
+            expires_at=expires_at,
+        )
+        return component
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+        return self._process_pool
+
+    def remove_callback(self, component: Component):
+        self._components_callback.remove(component.custom_id)
+        if self.persistent_store is not None:
+            self.persistent_store.submit(self.persistent_store.remove, component.custom_id)
+
+    def add_persistent_handler(self, name: str, handler):
+        self._persistent_handlers[name] = handler
+
+    def remove_persistent_handler(self, name: str):
+        self._persistent_handlers.pop(name, None)
+
+    def persistent_handler(self, name: str = None):
+        def decorator(func):
+            self.add_persistent_handler(name or func.__name__, func)
+            return func
+
+        return decorator
+
+    def add_persistent_callback(
+        self,
+        component: Component,
+        handler: str,
+        args: dict = None,
+        *,
+        uses: int = None,
+        timeout: float = None,
+        expires_at: Union[float, datetime] = None,
+    ):
+        if self.persistent_store is None:
+            raise RuntimeError("DiscordComponents was created without a persistent_store.")
+
+        if isinstance(expires_at, datetime):
+            expires_at = expires_at.timestamp()
+        if timeout is not None:
+            expires_at = min(time() + timeout, expires_at or float("inf"))
+
+        self.persistent_store.submit(
+            partial(
+                self.persistent_store.add,
+                component.custom_id,
+                handler,
+                args,
+                uses=uses,
+                expires_at=expires_at,
+            )
+        )
+        self._persistent_misses.pop(component.custom_id, None)
         return component
 
+    async def _rehydrate_callback(self, interaction: Interaction):
+        custom_id = interaction.custom_id
+        entry = await self.persistent_store.run(self.persistent_store.get, custom_id)
+        if entry is None:
+            self._persistent_misses[custom_id] = None
+            if len(self._persistent_misses) > _PERSISTENT_MISS_CACHE_SIZE:
+                self._persistent_misses.popitem(last=False)
+            return
+
+        handler = self._persistent_handlers.get(entry.handler)
+        if handler is None:
+            return
+
+        callback_info = self._components_callback.get(custom_id)
+        if callback_info is None:
+            callback_info = self._components_callback.add(
+                custom_id,
+                update_wrapper(partial(handler, **entry.args), handler),
+                uses=entry.uses,
+                expires_at=entry.expires_at,
+            )
+            callback_info["persistent"] = True
+        self._run_registered(interaction, callback_info)
+
+    def add_route(self, pattern: str, callback, *, prefix: bool = False, filter=None):
+        self.router.add(pattern, callback, prefix=prefix, filter=filter)
+
+    def remove_route(self, pattern: str, callback=None, *, prefix: bool = False):
+        self.router.remove(pattern, callback, prefix=prefix)
+
+    def route(self, pattern: str, *, prefix: bool = False, filter=None):
+        def decorator(func):
+            self.add_route(pattern, func, prefix=prefix, filter=filter)
+            return func
+
+        return decorator
+
+    def add_routes(self, obj):
+        for name in dir(obj):
+            method = getattr(obj, name, None)
+            for pattern, prefix, filter in getattr(method, "__component_routes__", ()):
+                self.add_route(pattern, method, prefix=prefix, filter=filter)
+
+    def remove_routes(self, obj):
+        for name in dir(obj):
+            method = getattr(obj, name, None)
+            for pattern, prefix, _ in getattr(method, "__component_routes__", ()):
+                self.remove_route(pattern, method, prefix=prefix)
+
 
 class ComponentsClient(Client):
     def __init__(self, *args, **kwargs):
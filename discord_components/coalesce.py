@@ -0,0 +1,99 @@
+from typing import Awaitable, Callable, Dict, List, Union
+
+from asyncio import Lock, Task, TimerHandle, ensure_future, gather, get_event_loop
+
+from .interaction import Interaction
+from .dpy_overrides import ComponentMessage
+
+
+__all__ = ("EditCoalescer",)
+
+
+_EXCLUSIVE_FIELDS = {"embed": "embeds", "embeds": "embed", "file": "files", "files": "file"}
+
+
+class _PendingEdit:
+    __slots__ = ("target", "fields", "defers", "handle")
+
+    def __init__(self, target: Union[Interaction, ComponentMessage]):
+        self.target = target
+        self.fields: dict = {}
+        self.defers: List[Task] = []
+        self.handle: TimerHandle = None
+
+
+class EditCoalescer:
+    def __init__(
+        self,
+        *,
+        window: float = 0.25,
+        on_error: Callable[[Union[Interaction, ComponentMessage]], Awaitable] = None,
+    ):
+        self.window = window
+        self.on_error = on_error
+
+        self.collapsed = 0
+        self.flushed = 0
+        self._pending: Dict[int, _PendingEdit] = {}
+        self._locks: Dict[int, List] = {}
+
+    def edit(self, target: Union[Interaction, ComponentMessage], **fields):
+        message_id = target.message_id if isinstance(target, Interaction) else target.id
+
+        pending = self._pending.get(message_id)
+        if pending is None:
+            pending = self._pending[message_id] = _PendingEdit(target)
+            pending.handle = get_event_loop().call_later(
+                self.window, lambda: ensure_future(self.flush(message_id))
+            )
+        else:
+            self.collapsed += 1
+            if isinstance(target, Interaction) or not isinstance(pending.target, Interaction):
+                pending.target = target
+
+        if isinstance(target, Interaction):
+            pending.defers.append(ensure_future(target.defer(edit_origin=True)))
+
+        for name, value in fields.items():
+            pending.fields.pop(_EXCLUSIVE_FIELDS.get(name), None)
+            pending.fields[name] = value
+
+    async def flush(self, message_id: int):
+        pending = self._pending.pop(message_id, None)
+        if pending is None:
+            return
+
+        pending.handle.cancel()
+
+        entry = self._locks.get(message_id)
+        if entry is None:
+            entry = self._locks[message_id] = [Lock(), 0]
+        entry[1] += 1
+
+        try:
+            async with entry[0]:
+                await self._send(pending)
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[message_id]
+
+    async def _send(self, pending: _PendingEdit):
+        try:
+            await gather(*pending.defers, return_exceptions=True)
+            if isinstance(pending.target, Interaction):
+                await pending.target.edit_origin(**pending.fields)
+            else:
+                await pending.target.edit(**pending.fields)
+        except Exception:
+            if self.on_error is not None:
+                await self.on_error(pending.target)
+        finally:
+            self.flushed += 1
+
+    async def flush_all(self):
+        await gather(*map(self.flush, list(self._pending)), return_exceptions=True)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,154 @@
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from discord import InvalidArgument
+
+from base64 import urlsafe_b64encode
+from enum import Enum
+from hashlib import sha256
+import hmac
+
+
+__all__ = ("CustomIdCodec",)
+
+
+_PREFIX = "$1"
+_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS = {char: i for i, char in enumerate(_ALPHABET)}
+_ESCAPES = {"%": "%25", ":": "%3A", "|": "%7C"}
+
+
+def _encode_int(value: int) -> str:
+    if value < 0:
+        return "-" + _encode_int(-value)
+    if value == 0:
+        return "0"
+
+    chars = []
+    while value:
+        value, digit = divmod(value, 62)
+        chars.append(_ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+def _decode_int(value: str) -> int:
+    if value.startswith("-"):
+        return -_decode_int(value[1:])
+
+    result = 0
+    for char in value:
+        result = result * 62 + _DIGITS[char]
+    return result
+
+
+def _encode_str(value: str) -> str:
+    for char, escape in _ESCAPES.items():
+        value = value.replace(char, escape)
+    return value
+
+
+def _decode_str(value: str) -> str:
+    for char, escape in reversed(list(_ESCAPES.items())):
+        value = value.replace(escape, char)
+    return value
+
+
+def _encode_arg(type: Type, value: Any) -> str:
+    if type is bool:
+        return "1" if value else "0"
+    if type is int:
+        return _encode_int(value)
+    if type is str:
+        return _encode_str(value)
+    if issubclass(type, int) and issubclass(type, Enum):
+        return _encode_int(int(value))
+    if issubclass(type, Enum):
+        return _encode_str(value.name)
+    raise InvalidArgument(f"Unsupported custom id argument type {type.__name__}.")
+
+
+def _decode_arg(type: Type, value: str) -> Any:
+    if type is bool:
+        return value == "1"
+    if type is int:
+        return _decode_int(value)
+    if type is str:
+        return _decode_str(value)
+    if issubclass(type, int) and issubclass(type, Enum):
+        return type(_decode_int(value))
+    return type[_decode_str(value)]
+
+
+class CustomIdCodec:
+    def __init__(self, *, secret: Union[str, bytes] = None, signature_length: int = 10):
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+
+        self.secret = secret
+        self.signature_length = signature_length
+        self._handlers: Dict[str, Tuple[Callable, Dict[str, Type]]] = {}
+
+    def register(self, name: str, callback: Callable, **types: Type):
+        if not name or any(char in name for char in _ESCAPES):
+            raise InvalidArgument("Handler names must be non-empty and must not contain % : |.")
+        self._handlers[name] = (callback, types)
+
+    def unregister(self, name: str):
+        self._handlers.pop(name, None)
+
+    def handler(self, name: str = None, **types: Type):
+        def decorator(func):
+            self.register(name or func.__name__, func, **types)
+            return func
+
+        return decorator
+
+    def encode(self, name: str, *args, **kwargs) -> str:
+        _, types = self._handlers[name]
+        values = dict(zip(types, args), **kwargs)
+        if len(args) > len(types) or set(values) != set(types):
+            raise InvalidArgument(f"Handler {name!r} takes the arguments {', '.join(types)}.")
+
+        body = ":".join(
+            [_PREFIX + name, *(_encode_arg(type, values[key]) for key, type in types.items())]
+        )
+        if self.secret is not None:
+            body += "|" + self._sign(body)
+
+        if len(body) > 100:
+            raise InvalidArgument("Encoded custom id is longer than 100 characters.")
+        return body
+
+    def matches(self, custom_id: str) -> bool:
+        return custom_id.startswith(_PREFIX)
+
+    def decode(self, custom_id: str) -> Optional[Tuple[str, Callable, dict]]:
+        if not custom_id.startswith(_PREFIX):
+            return None
+
+        body = custom_id
+        if self.secret is not None:
+            body, _, signature = custom_id.rpartition("|")
+            expected = self._sign(body).encode("ascii")
+            if not body or not hmac.compare_digest(signature.encode("utf-8"), expected):
+                return None
+
+        name, *values = body[len(_PREFIX) :].split(":")
+        handler = self._handlers.get(name)
+        if handler is None:
+            return None
+
+        callback, types = handler
+        if len(values) != len(types):
+            return None
+
+        try:
+            params = {
+                key: _decode_arg(type, value) for (key, type), value in zip(types.items(), values)
+            }
+        except (KeyError, ValueError):
+            return None
+        return name, callback, params
+
+    def _sign(self, body: str) -> str:
+        digest = hmac.new(self.secret, body.encode("utf-8"), sha256).digest()
+        return urlsafe_b64encode(digest).decode("ascii")[: self.signature_length]
@@ -12,7 +12,11 @@ __all__ = (
     "Select",
     "SelectOption",
     "ActionRow",
+    "ComponentView",
+    "ButtonView",
+    "SelectView",
     "_get_component_type",
+    "_get_component_view_type",
 )
 
 
@@ -25,6 +29,21 @@ def _get_partial_emoji(emoji: Union[Emoji, PartialEmoji, str]) -> PartialEmoji:
         return PartialEmoji(name=emoji)
 
 
+def _get_partial_emoji_from_json(emoji: Optional[dict]) -> Optional[PartialEmoji]:
+    if not emoji:
+        return None
+
+    return PartialEmoji(
+        name=emoji["name"],
+        animated=emoji.get("animated", False),
+        id=emoji.get("id"),
+    )
+
+
+def _same_dicts(new: List[dict], old: List[dict]) -> bool:
+    return len(new) == len(old) and all(a is b for a, b in zip(new, old))
+
+
 class Component:
     def to_dict(self) -> dict:
         raise NotImplementedError
@@ -35,7 +54,7 @@ class Component:
 
 
 class SelectOption(Component):
-    __slots__ = ("_label", "_value", "_emoji", "_description", "_default")
+    __slots__ = ("_label", "_value", "_emoji", "_description", "_default", "_dict")
 
     def __init__(
         self,
@@ -50,6 +69,7 @@ class SelectOption(Component):
         self._value = value
         self._description = description
         self._default = default
+        self._dict = None
 
         if emoji is not None:
             self.emoji = _get_partial_emoji(emoji)
@@ -57,6 +77,9 @@ class SelectOption(Component):
             self._emoji = None
 
     def to_dict(self) -> dict:
+        if self._dict is not None:
+            return self._dict
+
         data = {
             "label": self.label,
             "value": self.value,
@@ -65,6 +88,7 @@ class SelectOption(Component):
         }
         if self.emoji is not None:
             data["emoji"] = self.emoji.to_dict()
+        self._dict = data
         return data
 
     @property
@@ -93,22 +117,27 @@ class SelectOption(Component):
             raise InvalidArgument("Label must not be empty.")
 
         self._label = value
+        self._dict = None
 
     @value.setter
     def value(self, value: str):
         self._value = value
+        self._dict = None
 
     @emoji.setter
     def emoji(self, emoji: Union[Emoji, PartialEmoji, str]):
         self._emoji = _get_partial_emoji(emoji)
+        self._dict = None
 
     @description.setter
     def description(self, value: str):
         self._description = value
+        self._dict = None
 
     @default.setter
     def default(self, value: bool):
         self._default = value
+        self._dict = None
 
     def set_label(self, value: str):
         self.label = value
@@ -127,17 +156,10 @@ class SelectOption(Component):
 
     @classmethod
     def from_json(cls, data: dict):
-        emoji = data.get("emoji")
         return cls(
             label=data.get("label"),
             value=data.get("value"),
-            emoji=PartialEmoji(
-                name=emoji["name"],
-                animated=emoji.get("animated", False),
-                id=emoji.get("id"),
-            )
-            if emoji
-            else None,
+            emoji=_get_partial_emoji_from_json(data.get("emoji")),
             description=data.get("description"),
             default=data.get("default", False),
         )
@@ -151,6 +173,7 @@ class Select(Component):
         "_min_values",
         "_max_values",
         "_disabled",
+        "_dict",
     )
 
     def __init__(
@@ -173,17 +196,23 @@ class Select(Component):
         self._min_values = min_values
         self._max_values = max_values
         self._disabled = disabled
+        self._dict = None
 
     def to_dict(self) -> dict:
-        return {
+        options = [option.to_dict() for option in self.options]
+        if self._dict is not None and _same_dicts(options, self._dict["options"]):
+            return self._dict
+
+        self._dict = {
             "type": 3,
-            "options": list(map(lambda option: option.to_dict(), self.options)),
+            "options": options,
             "custom_id": self.id,
             "placeholder": self.placeholder,
             "min_values": self.min_values,
             "max_values": self.max_values,
             "disabled": self.disabled,
         }
+        return self._dict
 
     @property
     def id(self) -> str:
@@ -216,10 +245,12 @@ class Select(Component):
     @id.setter
     def id(self, value: str):
         self._id = value
+        self._dict = None
 
     @custom_id.setter
     def custom_id(self, value: str):
         self._id = value
+        self._dict = None
 
     @options.setter
     def options(self, value: List[SelectOption]):
@@ -227,22 +258,27 @@ class Select(Component):
             raise InvalidArgument("Options length should be between 1 and 25.")
 
         self._options = value
+        self._dict = None
 
     @placeholder.setter
     def placeholder(self, value: str):
         self._placeholder = value
+        self._dict = None
 
     @min_values.setter
     def min_values(self, value: int):
         self._min_values = value
+        self._dict = None
 
     @max_values.setter
     def max_values(self, value: int):
         self._max_values = value
+        self._dict = None
 
     @disabled.setter
     def disabled(self, value: bool):
         self._disabled = value
+        self._dict = None
 
     def set_id(self, value: str):
         self.id = value
@@ -287,7 +323,7 @@ class ButtonStyle(IntEnum):
 
 
 class Button(Component):
-    __slots__ = ("_style", "_label", "_id", "_url", "_disabled", "_emoji")
+    __slots__ = ("_style", "_label", "_id", "_url", "_disabled", "_emoji", "_dict")
 
     def __init__(
         self,
@@ -305,6 +341,7 @@ class Button(Component):
         self._label = label
         self._url = url
         self._disabled = disabled
+        self._dict = None
 
         if emoji is not None:
             self._emoji = _get_partial_emoji(emoji)
@@ -317,6 +354,9 @@ class Button(Component):
             self._id = None
 
     def to_dict(self) -> dict:
+        if self._dict is not None:
+            return self._dict
+
         data = {
             "type": 2,
             "style": self.style,
@@ -327,6 +367,7 @@ class Button(Component):
         }
         if self.emoji:
             data["emoji"] = self.emoji.to_dict()
+        self._dict = data
         return data
 
     @property
@@ -365,6 +406,7 @@ class Button(Component):
             raise InvalidArgument(f"Style must be between 1, {ButtonStyle.URL}.")
 
         self._style = value
+        self._dict = None
 
     @label.setter
     def label(self, value: str):
@@ -372,6 +414,7 @@ class Button(Component):
             raise InvalidArgument("Label should not be empty.")
 
         self._label = value
+        self._dict = None
 
     @url.setter
     def url(self, value: str):
@@ -379,6 +422,7 @@ class Button(Component):
             raise InvalidArgument("Button style is not URL. You shouldn't provide URL.")
 
         self._url = value
+        self._dict = None
 
     @id.setter
     def id(self, value: str):
@@ -388,6 +432,7 @@ class Button(Component):
             )
 
         self._id = value
+        self._dict = None
 
     @custom_id.setter
     def custom_id(self, value: str):
@@ -397,14 +442,17 @@ class Button(Component):
             )
 
         self._id = value
+        self._dict = None
 
     @disabled.setter
     def disabled(self, value: bool):
         self._disabled = value
+        self._dict = None
 
     @emoji.setter
     def emoji(self, emoji: Union[Emoji, PartialEmoji, str]):
         self._emoji = _get_partial_emoji(emoji)
+        self._dict = None
 
     def set_style(self, value: int):
         self.style = value
@@ -429,31 +477,27 @@ class Button(Component):
 
     @classmethod
     def from_json(cls, data: dict):
-        emoji = data.get("emoji")
         return cls(
             style=data.get("style"),
             label=data.get("label"),
             id=data.get("custom_id"),
             url=data.get("url"),
             disabled=data.get("disabled", False),
-            emoji=PartialEmoji(
-                name=emoji["name"],
-                animated=emoji.get("animated", False),
-                id=emoji.get("id"),
-            )
-            if emoji
-            else None,
+            emoji=_get_partial_emoji_from_json(data.get("emoji")),
         )
 
 
 class ActionRow(Component):
-    __slots__ = ("_components",)
+    __slots__ = ("_components", "_dict")
 
     def __init__(self, *args: List[Component]):
         self._components = list(args) if args is not None else []
+        self._dict = None
 
     def disable_components(self) -> List[Component]:
         def disable(component: Component):
+            if isinstance(component, ComponentView):
+                component = component.promote()
             component.disabled = True
             return component
 
@@ -479,11 +523,15 @@ class ActionRow(Component):
         del self._components[index]
 
     def to_dict(self) -> dict:
-        data = {
+        components = [component.to_dict() for component in self.components]
+        if self._dict is not None and _same_dicts(components, self._dict["components"]):
+            return self._dict
+
+        self._dict = {
             "type": 1,
-            "components": [component.to_dict() for component in self.components],
+            "components": components,
         }
-        return data
+        return self._dict
 
     def append(self, component: Component):
         self.components.append(component)
@@ -495,6 +543,7 @@ class ActionRow(Component):
     @components.setter
     def components(self, value: List[Component]):
         self._components = value
+        self._dict = None
 
     def set_components(self, value: List[Component]):
         self.components = value
@@ -509,5 +558,86 @@ class ActionRow(Component):
         )
 
 
+class ComponentView(Component):
+    __slots__ = ("_data", "_component")
+
+    _component_type = None
+    _fields = {}
+
+    def __init__(self, data: dict):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_component", None)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._component is not None:
+            return getattr(self._component, name)
+        if name in self._fields:
+            return self._fields[name](self._data)
+
+        return getattr(self.promote(), name)
+
+    def __setattr__(self, name: str, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        setattr(self.promote(), name, value)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} data={self._data!r}>"
+
+    @property
+    def promoted(self) -> bool:
+        return self._component is not None
+
+    def promote(self) -> Component:
+        if self._component is None:
+            object.__setattr__(self, "_component", self._component_type.from_json(self._data))
+        return self._component
+
+    def to_dict(self) -> dict:
+        if self._component is not None:
+            return self._component.to_dict()
+        return self._data
+
+    @classmethod
+    def from_json(cls, data: dict):
+        return cls(data)
+
+
+class SelectView(ComponentView):
+    __slots__ = ()
+
+    _component_type = Select
+    _fields = {
+        "id": lambda data: data.get("custom_id"),
+        "custom_id": lambda data: data.get("custom_id"),
+        "placeholder": lambda data: data.get("placeholder"),
+        "min_values": lambda data: data.get("min_values"),
+        "max_values": lambda data: data.get("max_values"),
+        "disabled": lambda data: data.get("disabled", False),
+    }
+
+
+class ButtonView(ComponentView):
+    __slots__ = ()
+
+    _component_type = Button
+    _fields = {
+        "style": lambda data: data.get("style"),
+        "label": lambda data: data.get("label"),
+        "id": lambda data: data.get("custom_id"),
+        "custom_id": lambda data: data.get("custom_id"),
+        "url": lambda data: data.get("url"),
+        "disabled": lambda data: data.get("disabled", False),
+        "emoji": lambda data: _get_partial_emoji_from_json(data.get("emoji")),
+    }
+
+
 def _get_component_type(type: int):
     return {1: ActionRow, 2: Button, 3: Select}[type]
+
+
+def _get_component_view_type(type: int):
+    return {2: ButtonView, 3: SelectView}[type]
@@ -0,0 +1,66 @@
+from typing import Dict, Optional
+
+from asyncio import TimerHandle, ensure_future, get_event_loop
+
+from discord import HTTPException
+
+from .interaction import Interaction
+
+
+__all__ = ("DeadlineGuard",)
+
+
+class DeadlineGuard:
+    def __init__(
+        self,
+        *,
+        margin: float = 0.5,
+        edit_origin: bool = True,
+        ephemeral: bool = True,
+        learn: bool = True,
+        smoothing: float = 0.2,
+    ):
+        self.margin = margin
+        self.edit_origin = edit_origin
+        self.ephemeral = ephemeral
+        self.learn = learn
+        self.smoothing = smoothing
+
+        self.deferred_count = 0
+        self._latency: Dict[str, float] = {}
+
+    def watch(self, interaction: Interaction, key: str = None) -> Optional[TimerHandle]:
+        budget = interaction.expires_in - self.margin
+        expected = self._latency.get(key) if key is not None else None
+
+        if budget <= 0 or (expected is not None and expected >= budget):
+            self._defer(interaction)
+            return None
+
+        return get_event_loop().call_later(budget, self._defer, interaction)
+
+    def record(self, key: str, elapsed: float):
+        if not self.learn or key is None:
+            return
+
+        latency = self._latency.get(key)
+        if latency is None:
+            self._latency[key] = elapsed
+        else:
+            self._latency[key] = latency + (elapsed - latency) * self.smoothing
+
+    def latency(self, key: str) -> Optional[float]:
+        return self._latency.get(key)
+
+    def _defer(self, interaction: Interaction):
+        if interaction.responded or interaction.deferred:
+            return
+
+        self.deferred_count += 1
+        ensure_future(self._safe_defer(interaction))
+
+    async def _safe_defer(self, interaction: Interaction):
+        try:
+            await interaction.defer(ephemeral=self.ephemeral, edit_origin=self.edit_origin)
+        except HTTPException:
+            pass
@@ -0,0 +1,42 @@
+from typing import List, Optional, Set
+
+
+__all__ = ("InteractionDeduplicator",)
+
+
+class InteractionDeduplicator:
+    __slots__ = ("size", "dropped", "_ring", "_seen", "_pos")
+
+    def __init__(self, size: int = 4096):
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+
+        self.size = size
+        self.dropped = 0
+        self._ring: List[Optional[str]] = [None] * size
+        self._seen: Set[str] = set()
+        self._pos = 0
+
+    def seen(self, interaction_id: str) -> bool:
+        if interaction_id in self._seen:
+            self.dropped += 1
+            return True
+
+        oldest = self._ring[self._pos]
+        if oldest is not None:
+            self._seen.discard(oldest)
+        self._ring[self._pos] = interaction_id
+        self._seen.add(interaction_id)
+        self._pos = (self._pos + 1) % self.size
+        return False
+
+    def clear(self):
+        self._ring = [None] * self.size
+        self._seen.clear()
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, interaction_id: str) -> bool:
+        return interaction_id in self._seen
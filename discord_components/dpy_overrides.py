@@ -1,4 +1,4 @@
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Tuple
 
 from discord import (
     Message,
@@ -14,30 +14,110 @@ from discord.abc import Messageable, Snowflake
 from discord.ext.commands import Context
 
 from .utils import _get_components_json, _form_files
-from .component import _get_component_type, ActionRow, Component
+from .encoder import _json_payload
+from .component import (
+    _get_component_type,
+    _get_component_view_type,
+    ActionRow,
+    Component,
+    ComponentView,
+)
 
 __all__ = ("ComponentMessage",)
 
 
 class ComponentMessage(Message):
-    __slots__ = tuple(list(Message.__slots__) + ["components", "ephemeral"])
+    __slots__ = tuple(list(Message.__slots__) + ["_components", "_component_index", "ephemeral"])
+
+    component_views: bool = False
 
     def __init__(self, *, state, channel, data, ephemeral=False):
         super().__init__(state=state, channel=channel, data=data)
         self.ephemeral = ephemeral
 
+        component_views = getattr(state, "_component_views", self.component_views)
+        get_type = _get_component_view_type if component_views else _get_component_type
         components = []
         for i in data["components"]:
             components.append(ActionRow())
             for j in i["components"]:
-                components[-1].append(_get_component_type(j["type"]).from_json(j))
+                components[-1].append(get_type(j["type"]).from_json(j))
         self.components: List[ActionRow] = components
 
+    @property
+    def components(self) -> List[ActionRow]:
+        return self._components
+
+    @components.setter
+    def components(self, value: List[ActionRow]):
+        self._components = value
+        self._build_component_index()
+
+    def _build_component_index(self):
+        self._component_index: Dict[str, Tuple[int, int, Component]] = {}
+        for row_index, row in enumerate(self._components):
+            for index, component in enumerate(row.components):
+                custom_id = component.custom_id
+                if custom_id is not None:
+                    self._component_index[custom_id] = (row_index, index, component)
+
+    def _find_component(self, custom_id: str) -> Optional[Tuple[int, int, Component]]:
+        entry = self._component_index.get(custom_id)
+        if entry is not None:
+            row_index, index, component = entry
+            try:
+                if (
+                    self._components[row_index].components[index] is component
+                    and component.custom_id == custom_id
+                ):
+                    return entry
+            except IndexError:
+                pass
+
+        self._build_component_index()
+        return self._component_index.get(custom_id)
+
     def get_component(self, custom_id: str) -> Optional[Component]:
-        for row in self.components:
-            for component in row.components:
-                if component.custom_id == custom_id:
-                    return component
+        entry = self._find_component(custom_id)
+        return entry[2] if entry is not None else None
+
+    def replace_component(self, custom_id: str, component: Component) -> Component:
+        entry = self._find_component(custom_id)
+        if entry is None:
+            raise KeyError(custom_id)
+
+        row_index, index, old = entry
+        self._components[row_index][index] = component
+        del self._component_index[custom_id]
+        if component.custom_id is not None:
+            self._component_index[component.custom_id] = (row_index, index, component)
+        return old
+
+    def disable_component(self, custom_id: str) -> Component:
+        entry = self._find_component(custom_id)
+        if entry is None:
+            raise KeyError(custom_id)
+
+        row_index, index, component = entry
+        if isinstance(component, ComponentView):
+            component = component.promote()
+            self._components[row_index][index] = component
+            self._component_index[custom_id] = (row_index, index, component)
+        component.disabled = True
+        return component
+
+    def remove_component(self, custom_id: str) -> Component:
+        entry = self._find_component(custom_id)
+        if entry is None:
+            raise KeyError(custom_id)
+
+        row_index, index, component = entry
+        row = self._components[row_index]
+        del row[index]
+        if not len(row):
+            del self._components[row_index]
+        self._build_component_index()
+        return component
 
     async def disable_components(self) -> None:
         await self.edit(
@@ -102,7 +182,7 @@ class ComponentMessage(Message):
                     channel_id=self.channel.id,
                     message_id=self.id,
                 ),
-                json=data,
+                data=_json_payload(data),
             )
 
         if delete_after is not None:
@@ -208,7 +288,7 @@ def send_message(
 
     return self.request(
         Route("POST", "/channels/{channel_id}/messages", channel_id=channel_id),
-        json=payload,
+        data=_json_payload(payload),
     )
 
 
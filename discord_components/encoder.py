@@ -0,0 +1,92 @@
+from typing import Any, Callable, Union
+
+from aiohttp.payload import BytesPayload
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+__all__ = ("set_json_encoder", "get_json_encoder", "RawJSON")
+
+
+class RawJSON(bytes):
+    __slots__ = ()
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+
+
+def _ujson_dumps(obj: Any) -> bytes:
+    return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+if orjson is not None:
+    _default_dumps = orjson.dumps
+elif ujson is not None:
+    _default_dumps = _ujson_dumps
+else:
+    _default_dumps = _stdlib_dumps
+
+_dumps: Callable[[Any], bytes] = _default_dumps
+
+
+def set_json_encoder(encoder: Callable[[Any], Union[str, bytes]] = None):
+    global _dumps
+
+    if encoder is None:
+        _dumps = _default_dumps
+        return
+
+    def dumps(obj: Any) -> bytes:
+        res = encoder(obj)
+        return res.encode("utf-8") if isinstance(res, str) else res
+
+    _dumps = dumps
+
+
+def get_json_encoder() -> Callable[[Any], bytes]:
+    return _dumps
+
+
+def _contains_raw(obj: dict) -> bool:
+    return any(
+        isinstance(value, RawJSON) or (isinstance(value, dict) and _contains_raw(value))
+        for value in obj.values()
+    )
+
+
+def _dumps_with_raw(obj: dict) -> bytes:
+    plain = {}
+    raw = []
+    for key, value in obj.items():
+        if isinstance(value, RawJSON):
+            raw.append((key, value))
+        elif isinstance(value, dict) and _contains_raw(value):
+            raw.append((key, _dumps_with_raw(value)))
+        else:
+            plain[key] = value
+
+    head = _dumps(plain).rstrip()[:-1].rstrip()
+    fragments = b",".join(_dumps(key) + b":" + value for key, value in raw)
+    return head + (b"" if head.endswith(b"{") else b",") + fragments + b"}"
+
+
+def _encode(obj: Any) -> bytes:
+    if isinstance(obj, RawJSON):
+        return obj
+    if isinstance(obj, dict) and _contains_raw(obj):
+        return _dumps_with_raw(obj)
+    return _dumps(obj)
+
+
+def _json_payload(obj: Any) -> BytesPayload:
+    return BytesPayload(_encode(obj), content_type="application/json")
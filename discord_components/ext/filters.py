@@ -1,7 +1,14 @@
-from discord import Message, Guild, TextChannel, User
+from typing import Callable, Hashable, Sequence, Union
+
+from discord import HTTPException, Message, Guild, TextChannel, User
+
+from asyncio import ensure_future
+from collections import OrderedDict
+from time import monotonic
 
 from discord_components.interaction import Interaction
 from discord_components.component import Component, Button, SelectOption
+from discord_components.encoder import RawJSON, get_json_encoder
 
 
 __all__ = (
@@ -10,15 +17,26 @@ __all__ = (
     "guild_filter",
     "channel_filter",
     "user_filter",
+    "Cooldown",
+    "cooldown_filter",
 )
 
 
+_KEY_ATTRIBUTES = {
+    "user": "user_id",
+    "guild": "guild_id",
+    "channel": "channel_id",
+    "message": "message_id",
+    "custom_id": "custom_id",
+}
+
+
 def message_filter(message: Message, ephemeral: bool = False):
     def _filter(interaction: Interaction):
-        if ephemeral or isinstance(interaction.message, dict):
+        if ephemeral:
             return False
 
-        return interaction.message.id == message.id
+        return interaction.message_id == message.id
 
     return _filter
 
@@ -46,6 +64,91 @@ def channel_filter(channel: TextChannel):
 
 def user_filter(user: User):
     def _filter(interaction: Interaction):
-        return interaction.user.id == user.id
+        return interaction.user_id == user.id
 
     return _filter
+
+
+class Cooldown:
+    def __init__(
+        self,
+        rate: int,
+        per: float,
+        *,
+        key: Union[str, Sequence[str], Callable[[Interaction], Hashable]] = "user",
+        max_size: int = 10000,
+        message: str = None,
+    ):
+        if isinstance(key, str):
+            key = (key,)
+        if not callable(key):
+            attributes = tuple(_KEY_ATTRIBUTES[name] for name in key)
+            key = lambda interaction: tuple(getattr(interaction, name) for name in attributes)
+
+        self.rate = rate
+        self.per = per
+        self.key = key
+        self.max_size = max_size
+        self.rejected = 0
+
+        self._buckets: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._response = None
+        if message is not None:
+            self._response = RawJSON(get_json_encoder()({"content": message, "flags": 64}))
+
+    def _purge(self, now: float):
+        buckets = self._buckets
+        while buckets:
+            bucket_key, (_, updated) = next(iter(buckets.items()))
+            if now - updated < self.per and len(buckets) < self.max_size:
+                break
+            del buckets[bucket_key]
+
+    def update(self, interaction: Interaction) -> float:
+        now = monotonic()
+        self._purge(now)
+
+        bucket_key = self.key(interaction)
+        bucket = self._buckets.pop(bucket_key, None)
+        if bucket is None:
+            tokens = self.rate
+        else:
+            tokens = min(self.rate, bucket[0] + (now - bucket[1]) * self.rate / self.per)
+
+        if tokens < 1:
+            self._buckets[bucket_key] = [tokens, now]
+            return (1 - tokens) * self.per / self.rate
+
+        self._buckets[bucket_key] = [tokens - 1, now]
+        return 0.0
+
+    def __call__(self, interaction: Interaction) -> bool:
+        if not self.update(interaction):
+            return True
+
+        self.rejected += 1
+        if self._response is not None and not (interaction.responded or interaction.deferred):
+            interaction.responded = True
+            ensure_future(self._respond(interaction))
+        return False
+
+    async def _respond(self, interaction: Interaction):
+        try:
+            await interaction.client.http.initial_response(
+                interaction_id=interaction.interaction_id,
+                interaction_token=interaction.interaction_token,
+                data={"type": 4, "data": self._response},
+            )
+        except HTTPException:
+            pass
+
+
+def cooldown_filter(
+    rate: int,
+    per: float,
+    *,
+    key: Union[str, Sequence[str], Callable[[Interaction], Hashable]] = "user",
+    max_size: int = 10000,
+    message: str = None,
+):
+    return Cooldown(rate, per, key=key, max_size=max_size, message=message)
@@ -0,0 +1,247 @@
+from typing import List, Optional, Sequence, Union
+
+from asyncio import ensure_future, get_event_loop, Task, TimerHandle
+from collections import OrderedDict
+
+from discord import Embed, HTTPException, User
+from discord.abc import Messageable
+
+from discord_components.client import DiscordComponents
+from discord_components.component import Button, ButtonStyle, Select, SelectOption
+from discord_components.dpy_overrides import ComponentMessage
+from discord_components.interaction import Interaction
+from discord_components.registry import CallbackRegistry, EvictionReason
+from discord_components.encoder import RawJSON
+from discord_components.template import ComponentTemplate, Slot
+
+
+__all__ = ("PageSource", "ListPageSource", "Paginator", "setup_paginators")
+
+
+_ROUTE = "dcp:{action}:{page:int}"
+
+
+def _controls_template(disabled: bool) -> ComponentTemplate:
+    return ComponentTemplate(
+        [
+            [
+                Button(
+                    style=ButtonStyle.blue,
+                    emoji="⏮️",
+                    custom_id="dcp:first:0",
+                    disabled=disabled,
+                ),
+                Button(
+                    style=ButtonStyle.blue,
+                    emoji="◀️",
+                    custom_id=Slot("prev"),
+                    disabled=disabled,
+                ),
+                Button(label=Slot("label"), custom_id=Slot("page"), disabled=True),
+                Button(
+                    style=ButtonStyle.blue,
+                    emoji="▶️",
+                    custom_id=Slot("next"),
+                    disabled=disabled,
+                ),
+                Button(
+                    style=ButtonStyle.blue,
+                    emoji="⏭️",
+                    custom_id=Slot("last"),
+                    disabled=disabled,
+                ),
+            ]
+        ]
+    )
+
+
+_CONTROLS = {False: _controls_template(False), True: _controls_template(True)}
+
+
+class PageSource:
+    async def get_page_count(self) -> int:
+        raise NotImplementedError
+
+    async def get_page(self, index: int) -> Union[str, Embed, dict]:
+        raise NotImplementedError
+
+
+class ListPageSource(PageSource):
+    def __init__(self, pages: Sequence[Union[str, Embed, dict]]):
+        self.pages = pages
+
+    async def get_page_count(self) -> int:
+        return len(self.pages)
+
+    async def get_page(self, index: int) -> Union[str, Embed, dict]:
+        return self.pages[index]
+
+
+def _get_registry(client: DiscordComponents) -> CallbackRegistry:
+    registry = getattr(client, "_paginators", None)
+    if registry is None:
+
+        def on_evict(message_id: str, callback_info: dict, reason: str):
+            if reason == EvictionReason.evicted:
+                return callback_info["callback"].__self__.stop()
+
+        registry = client._paginators = CallbackRegistry(max_size=10000, on_evict=on_evict)
+        client.add_route(_ROUTE, _on_click)
+    return registry
+
+
+def setup_paginators(client: DiscordComponents):
+    _get_registry(client)
+
+
+def setup(bot):
+    setup_paginators(bot.components_manager)
+
+
+async def _on_click(interaction: Interaction, action: str, page: int):
+    callback_info = _get_registry(interaction.client).get(str(interaction.message_id))
+    if callback_info is None:
+        await interaction.disable_components()
+        await interaction.send_followup("This paginator has expired.")
+        return
+
+    await callback_info["callback"](interaction, action, page)
+
+
+class Paginator:
+    def __init__(
+        self,
+        client: DiscordComponents,
+        source: Union[PageSource, Sequence[Union[str, Embed, dict]]],
+        *,
+        user: User = None,
+        use_select: bool = False,
+        timeout: float = 180,
+        cache_size: int = 8,
+        prefetch: bool = True,
+    ):
+        self.client = client
+        self.source = source if isinstance(source, PageSource) else ListPageSource(source)
+        self.user = user
+        self.use_select = use_select
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.prefetch = prefetch
+
+        self.index = 0
+        self.page_count = 0
+        self.message: Optional[ComponentMessage] = None
+
+        self._cache: "OrderedDict[int, dict]" = OrderedDict()
+        self._loading = {}
+        self._timer: Optional[TimerHandle] = None
+
+    async def start(self, channel: Messageable, index: int = 0) -> ComponentMessage:
+        self.page_count = await self.source.get_page_count()
+        self.index = index
+
+        page = await self.get_page(self.index)
+        self.message = await channel.send(**page, components=self.get_components())
+
+        _get_registry(self.client).add(str(self.message.id), self._on_click)
+        self._reset_timer()
+        return self.message
+
+    async def get_page(self, index: int) -> dict:
+        page = self._cache.get(index)
+        if page is not None:
+            self._cache.move_to_end(index)
+        else:
+            task = self._loading.get(index)
+            if task is None:
+                task = self._schedule_load(index)
+            page = await task
+
+        if self.prefetch and self.page_count:
+            for neighbour in (index - 1, index + 1):
+                neighbour %= self.page_count
+                if neighbour not in self._cache and neighbour not in self._loading:
+                    self._schedule_load(neighbour)
+        return page
+
+    def _schedule_load(self, index: int) -> Task:
+        task = self._loading[index] = ensure_future(self._load_page(index))
+        task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return task
+
+    async def _load_page(self, index: int) -> dict:
+        try:
+            page = await self.source.get_page(index)
+        finally:
+            self._loading.pop(index, None)
+
+        if isinstance(page, Embed):
+            page = {"embed": page}
+        elif not isinstance(page, dict):
+            page = {"content": str(page)}
+
+        self._cache[index] = page
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return page
+
+    def get_components(self, disabled: bool = False) -> Union[List[Select], RawJSON]:
+        last = self.page_count - 1
+        if self.use_select:
+            start = min(max(self.index - 12, 0), max(self.page_count - 25, 0))
+            return [
+                Select(
+                    custom_id=f"dcp:select:{self.index}",
+                    options=[
+                        SelectOption(label=f"Page {i + 1}", value=str(i), default=i == self.index)
+                        for i in range(start, min(start + 25, self.page_count))
+                    ],
+                    disabled=disabled,
+                )
+            ]
+
+        return _CONTROLS[disabled].render(
+            prev=f"dcp:prev:{self.index - 1 if self.index else last}",
+            label=f"Page {self.index + 1}/{self.page_count}",
+            page=f"dcp:page:{self.index}",
+            next=f"dcp:next:{self.index + 1 if self.index < last else 0}",
+            last=f"dcp:last:{last}",
+        )
+
+    async def _on_click(self, interaction: Interaction, action: str, page: int):
+        if self.user is not None and interaction.user_id != self.user.id:
+            await interaction.respond(content="This paginator is not yours.")
+            return
+
+        if action == "select":
+            page = int(interaction.values[0])
+        if not 0 <= page < self.page_count:
+            return
+
+        self.index = page
+        self._reset_timer()
+        page = await self.get_page(page)
+        await interaction.edit_origin(**page, components=self.get_components())
+
+    def _reset_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.timeout is not None:
+            self._timer = get_event_loop().call_later(self.timeout, self.stop)
+
+    def stop(self) -> Optional[Task]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.message is None:
+            return None
+
+        _get_registry(self.client).remove(str(self.message.id))
+        self._cache.clear()
+        return ensure_future(self._disable())
+
+    async def _disable(self):
+        try:
+            await self.message.edit(components=self.get_components(disabled=True))
+        except HTTPException:
+            pass
@@ -0,0 +1,33 @@
+from typing import AsyncIterator, Callable, Optional
+
+from discord import File
+
+
+__all__ = ("StreamingFile",)
+
+
+class StreamingFile(File):
+    __slots__ = ("source", "size")
+
+    def __init__(
+        self,
+        source: Callable[[], AsyncIterator[bytes]],
+        filename: str,
+        *,
+        size: int = None,
+        spoiler: bool = False,
+    ):
+        self.fp = None
+        self.source = source
+        self.size: Optional[int] = size
+
+        if spoiler and not filename.startswith("SPOILER_"):
+            filename = "SPOILER_" + filename
+        self.filename = filename
+        self.spoiler = filename.startswith("SPOILER_")
+
+    def reset(self, *, seek: bool = True):
+        pass
+
+    def close(self):
+        pass
@@ -1,17 +1,82 @@
-from typing import List
+from typing import List, Optional
 
-from discord import Client, File
+from discord import Client, File, HTTPException
 from discord.http import Route
 
+from time import perf_counter
+
 from .utils import _form_files
+from .encoder import _json_payload
+from .metrics import Metrics
+from .tracing import Tracer, _span
 
 
 __all__ = ("HTTPClient",)
 
 
 class HTTPClient:
-    def __init__(self, bot: Client):
+    def __init__(self, bot: Client, *, metrics: Metrics = None, tracer: Tracer = None):
         self.bot = bot
+        self.metrics = metrics
+        self.tracer = tracer
+
+    def _request(
+        self,
+        endpoint: str,
+        route: Route,
+        *,
+        interaction_id: int = None,
+        response_type: int = None,
+        **kwargs,
+    ):
+        if self.metrics is None and self.tracer is None:
+            return self.bot.http.request(route, **kwargs)
+        return self._instrumented_request(endpoint, route, interaction_id, response_type, kwargs)
+
+    async def _instrumented_request(
+        self,
+        endpoint: str,
+        route: Route,
+        interaction_id: Optional[int],
+        response_type: Optional[int],
+        kwargs: dict,
+    ):
+        with _span(
+            self.tracer,
+            "http.request",
+            {"http.method": route.method, "endpoint": endpoint, "response_type": response_type},
+        ):
+            if self.metrics is None:
+                return await self.bot.http.request(route, **kwargs)
+            return await self._measured_request(
+                endpoint, route, interaction_id, response_type, kwargs
+            )
+
+    async def _measured_request(
+        self,
+        endpoint: str,
+        route: Route,
+        interaction_id: Optional[int],
+        response_type: Optional[int],
+        kwargs: dict,
+    ):
+        metrics = self.metrics
+        labels = {"endpoint": endpoint}
+        if response_type is not None:
+            labels["type"] = str(response_type)
+
+        start = perf_counter()
+        try:
+            res = await self.bot.http.request(route, **kwargs)
+        except HTTPException as e:
+            metrics.inc("http_errors_total", status=str(e.status), **labels)
+            raise
+        finally:
+            metrics.observe("http_request_seconds", perf_counter() - start, **labels)
+
+        if interaction_id is not None:
+            metrics.observe_ack(interaction_id, response_type)
+        return res
 
     def edit_response(
         self, interaction_token: str, data: dict, files: List[File] = None
@@ -22,14 +87,11 @@ class HTTPClient:
         )
 
         if files is not None:
-            return self.bot.http.request(
-                route, data=_form_files(data, files), files=files
+            return self._request(
+                "edit_response", route, data=_form_files(data, files), files=files
             )
         else:
-            return self.bot.http.request(
-                route,
-                json=data,
-            )
+            return self._request("edit_response", route, data=_json_payload(data))
 
     def initial_response(
         self,
@@ -43,12 +105,52 @@ class HTTPClient:
             f"/interactions/{interaction_id}/{interaction_token}/callback",
         )
 
+        ack = {"interaction_id": interaction_id, "response_type": data.get("type")}
+        if files is not None:
+            return self._request(
+                "initial_response", route, data=_form_files(data, files), files=files, **ack
+            )
+        else:
+            return self._request("initial_response", route, data=_json_payload(data), **ack)
+
+    def send_followup(
+        self, interaction_token: str, data: dict, files: List[File] = None
+    ):
+        route = Route(
+            "POST",
+            f"/webhooks/{self.bot.user.id}/{interaction_token}",
+        )
+
         if files is not None:
-            return self.bot.http.request(
-                route, data=_form_files(data, files), files=files
+            return self._request(
+                "send_followup", route, data=_form_files(data, files), files=files
             )
         else:
-            return self.bot.http.request(
-                route,
-                json=data,
+            return self._request("send_followup", route, data=_json_payload(data))
+
+    def edit_followup(
+        self,
+        interaction_token: str,
+        message_id: int,
+        data: dict,
+        files: List[File] = None,
+    ):
+        route = Route(
+            "PATCH",
+            f"/webhooks/{self.bot.user.id}/{interaction_token}/messages/{message_id}",
+        )
+
+        if files is not None:
+            return self._request(
+                "edit_followup", route, data=_form_files(data, files), files=files
             )
+        else:
+            return self._request("edit_followup", route, data=_json_payload(data))
+
+    def delete_followup(self, interaction_token: str, message_id: int):
+        route = Route(
+            "DELETE",
+            f"/webhooks/{self.bot.user.id}/{interaction_token}/messages/{message_id}",
+        )
+
+        return self._request("delete_followup", route)
@@ -1,4 +1,4 @@
-from typing import List, Union, Optional
+from typing import List, Optional, Tuple, Union
 
 from discord import (
     User,
@@ -14,17 +14,32 @@ from discord import (
 )
 from discord.state import ConnectionState
 from discord.abc import Messageable
+from discord.utils import snowflake_time, DISCORD_EPOCH
 
+from asyncio import Lock, ensure_future, sleep
+from datetime import datetime
 from enum import IntEnum
+from time import time
 
 from .utils import _get_components_json
 from .component import Component, ActionRow, Button, Select
 from .dpy_overrides import ComponentMessage
+from .tracing import _span
+from .encoder import RawJSON, _encode
 
 
 __all__ = ("Interaction", "InteractionEventType")
 
 
+_MISSING = object()
+
+INTERACTION_RESPONSE_TIMEOUT = 3.0
+
+
+def _snowflake_timestamp(snowflake: int) -> float:
+    return ((int(snowflake) >> 22) + DISCORD_EPOCH) / 1000
+
+
 class InteractionEventType(IntEnum):
     button_click = 2
     select_option = 3
@@ -53,23 +68,12 @@ class Interaction:
         if self.guild_id is not None:
             self.guild_id = int(self.guild_id)
 
-        if self.guild:
-            self.user: Union[User, Member] = Member(
-                state=state, guild=self.guild, data=raw_data["member"]
-            )
-        elif raw_data.get("member"):
-            self.user: Union[User, Member] = User(state=state, data=raw_data["member"]["user"])
+        self.message_id: int = int(raw_data["message"]["id"])
+        self.ephemeral: bool = raw_data["message"].get("flags") == 64
+        if raw_data.get("member"):
+            self.user_id: int = int(raw_data["member"]["user"]["id"])
         else:
-            self.user: Union[User, Member] = User(state=state, data=raw_data["user"])
-        self.author: Union[User, Member] = self.user
-
-        self.message: Union[ComponentMessage, dict] = ComponentMessage(
-            state=state,
-            channel=self.channel,
-            data=raw_data["message"],
-            ephemeral=raw_data["message"].get("flags") == 64,
-        )
-        self.component: Component = self.message.get_component(custom_id=self.custom_id)
+            self.user_id: int = int(raw_data["user"]["id"])
 
         self.raw_data: dict = raw_data
         self.responded: bool = False
@@ -77,45 +81,93 @@ class Interaction:
 
         self._deferred_hidden = False
         self._deferred_edit_origin = False
+        self._lock = None
+
+        self._user = None
+        self._message = None
+        self._component = _MISSING
+        self._channel = None
+
+    @property
+    def user(self) -> Union[User, Member]:
+        if self._user is None:
+            if self.guild:
+                self._user = Member(
+                    state=self.state, guild=self.guild, data=self.raw_data["member"]
+                )
+            elif self.raw_data.get("member"):
+                self._user = User(state=self.state, data=self.raw_data["member"]["user"])
+            else:
+                self._user = User(state=self.state, data=self.raw_data["user"])
+        return self._user
+
+    @property
+    def author(self) -> Union[User, Member]:
+        return self.user
+
+    @property
+    def message(self) -> Union[ComponentMessage, dict]:
+        if self._message is None:
+            self._message = ComponentMessage(
+                state=self.state,
+                channel=self.channel,
+                data=self.raw_data["message"],
+                ephemeral=self.ephemeral,
+            )
+        return self._message
+
+    @property
+    def component(self) -> Optional[Component]:
+        if self._component is _MISSING:
+            self._component = self.message.get_component(custom_id=self.custom_id)
+        return self._component
 
     @property
     def channel(self) -> Optional[Messageable]:
-        return self.state.get_channel(self.channel_id)
+        if self._channel is None:
+            self._channel = self.state.get_channel(self.channel_id)
+        return self._channel
 
     @property
     def guild(self) -> Optional[Guild]:
         return self.state._get_guild(self.guild_id)
 
+    @property
+    def created_at(self) -> datetime:
+        return snowflake_time(self.interaction_id)
+
+    @property
+    def expires_in(self) -> float:
+        return (
+            _snowflake_timestamp(self.interaction_id) + INTERACTION_RESPONSE_TIMEOUT - time()
+        )
+
     async def defer(self, ephemeral: bool = True, edit_origin: bool = False):
         if self.deferred or self.responded:
             return
 
-        await self.respond(type=5 if not edit_origin else 6, ephemeral=ephemeral)
+        with _span(self.client.tracer, "interaction.defer", {"edit_origin": edit_origin}):
+            await self.respond(type=5 if not edit_origin else 6, ephemeral=ephemeral)
 
         if ephemeral:
             self._deferred_hidden = True
-        self._deferred_edit_origin = edit_origin
 
-    async def respond(
+    def _get_message_data(
         self,
         *,
-        type: int = 4,
         content: str = None,
         embed: Embed = None,
         embeds: List[Embed] = None,
-        suppress: bool = None,
-        file: File = None,
-        files: List[File] = None,
         allowed_mentions: AllowedMentions = None,
-        tts: bool = False,
-        ephemeral: bool = True,
+        tts: bool = None,
+        ephemeral: bool = False,
         components: List[Union[ActionRow, Component, List[Component]]] = None,
-    ) -> Optional[Union[ComponentMessage, dict]]:
-        if self.responded:
-            return
-
+    ) -> dict:
         state = self.state
-        data = {"tts": tts}
+        data = {}
+
+        if tts is not None:
+            data["tts"] = tts
 
         if ephemeral:
             data["flags"] = 64
@@ -134,13 +186,6 @@ class Interaction:
                 raise InvalidArgument("embeds parameter must be a list of up to 10 elements")
             data["embeds"] = [embed.to_dict() for embed in embeds]
 
-        if suppress is not None:
-            flags = MessageFlags._from_value(
-                self.message.flags if isinstance(self.message, ComponentMessage) else 0
-            )
-            flags.suppress_embeds = suppress
-            data["flags"] = flags.value
-
         if allowed_mentions is not None:
             if state.allowed_mentions is not None:
                 data["allowed_mentions"] = state.allowed_mentions.merge(allowed_mentions).to_dict()
@@ -152,9 +197,10 @@ class Interaction:
         if components is not None:
             data["components"] = _get_components_json(components)
 
-        if not self.deferred:
-            data = {"type": type, "data": data}
+        return data
 
+    @staticmethod
+    def _get_files(file: File = None, files: List[File] = None) -> Optional[List[File]]:
         if file is not None and files is not None:
             raise InvalidArgument("cannot pass both file and files parameter to send()")
         elif files is not None:
@@ -162,30 +208,82 @@ class Interaction:
                 raise InvalidArgument("files parameter must be a list of up to 10 elements")
         if file is not None:
             files = [file]
+        return files
 
-        try:
-            if self.deferred:
-                res = await self.client.http.edit_response(
-                    interaction_token=self.interaction_token, data=data, files=files
-                )
-            else:
-                res = await self.client.http.initial_response(
-                    interaction_id=self.interaction_id,
-                    interaction_token=self.interaction_token,
-                    data=data,
-                    files=files,
-                )
+    async def respond(
+        self,
+        *,
+        type: int = 4,
+        content: str = None,
+        embed: Embed = None,
+        embeds: List[Embed] = None,
+        suppress: bool = None,
+        file: File = None,
+        files: List[File] = None,
+        allowed_mentions: AllowedMentions = None,
+        tts: bool = False,
+        ephemeral: bool = True,
+        components: List[Union[ActionRow, Component, List[Component]]] = None,
+    ) -> Optional[Union[ComponentMessage, dict]]:
+        if self.responded:
+            return
 
-            if type in (4, 7):
-                self.responded = True
-            else:
-                self.deferred = True
-        except NotFound as e:
-            self.responded = True
-            raise NotFound(
-                e.response,
-                "Interaction is unknown (you have already responded to the interaction or responding took too long)",
-            ) from None
+        state = self.state
+        data = self._get_message_data(
+            content=content,
+            embed=embed,
+            embeds=embeds,
+            allowed_mentions=allowed_mentions,
+            tts=tts,
+            ephemeral=ephemeral,
+            components=components,
+        )
+
+        if suppress is not None:
+            flags = MessageFlags._from_value(
+                self.message.flags if isinstance(self.message, ComponentMessage) else 0
+            )
+            flags.suppress_embeds = suppress
+            data["flags"] = flags.value
+
+        files = self._get_files(file, files)
+
+        if self._lock is None:
+            self._lock = Lock()
+
+        with _span(self.client.tracer, "interaction.respond", {"type": type}):
+            async with self._lock:
+                if self.responded or (type in (5, 6) and self.deferred):
+                    return
+
+                try:
+                    if self.deferred and type == 4 and self._deferred_edit_origin:
+                        res = await self.client.http.send_followup(
+                            interaction_token=self.interaction_token, data=data, files=files
+                        )
+                    elif self.deferred:
+                        res = await self.client.http.edit_response(
+                            interaction_token=self.interaction_token, data=data, files=files
+                        )
+                    else:
+                        res = await self.client.http.initial_response(
+                            interaction_id=self.interaction_id,
+                            interaction_token=self.interaction_token,
+                            data={"type": type, "data": data},
+                            files=files,
+                        )
+
+                    if type in (4, 7):
+                        self.responded = True
+                    else:
+                        self.deferred = True
+                        self._deferred_edit_origin = type == 6
+                except NotFound as e:
+                    self.responded = True
+                    raise NotFound(
+                        e.response,
+                        "Interaction is unknown (you have already responded to the interaction or responding took too long)",
+                    ) from None
 
         if type in (4, 7) and isinstance(res, dict):
             return ComponentMessage(
@@ -259,6 +357,129 @@ class Interaction:
         elif res is not None:
             await res.delete(delay=delete_after)
 
+    def _get_followup_payload(
+        self,
+        content: str = None,
+        *,
+        embed: Embed = None,
+        embeds: List[Embed] = None,
+        file: File = None,
+        files: List[File] = None,
+        allowed_mentions: AllowedMentions = None,
+        tts: bool = False,
+        ephemeral: bool = True,
+        components: List[Union[ActionRow, Component, List[Component]]] = None,
+    ) -> Tuple[Union[dict, RawJSON], Optional[List[File]]]:
+        data = self._get_message_data(
+            content=content,
+            embed=embed,
+            embeds=embeds,
+            allowed_mentions=allowed_mentions,
+            tts=tts,
+            ephemeral=ephemeral,
+            components=components,
+        )
+        files = self._get_files(file, files)
+        return (data if files is not None else RawJSON(_encode(data))), files
+
+    async def send_followup(
+        self,
+        content: str = None,
+        *,
+        embed: Embed = None,
+        embeds: List[Embed] = None,
+        file: File = None,
+        files: List[File] = None,
+        allowed_mentions: AllowedMentions = None,
+        tts: bool = False,
+        ephemeral: bool = True,
+        components: List[Union[ActionRow, Component, List[Component]]] = None,
+    ) -> Union[ComponentMessage, dict]:
+        data, files = self._get_followup_payload(
+            content,
+            embed=embed,
+            embeds=embeds,
+            file=file,
+            files=files,
+            allowed_mentions=allowed_mentions,
+            tts=tts,
+            ephemeral=ephemeral,
+            components=components,
+        )
+        res = await self.client.http.send_followup(
+            interaction_token=self.interaction_token, data=data, files=files
+        )
+        return self._get_followup_message(res)
+
+    async def edit_followup(
+        self,
+        message: Union[ComponentMessage, int],
+        content: str = None,
+        *,
+        embed: Embed = None,
+        embeds: List[Embed] = None,
+        file: File = None,
+        files: List[File] = None,
+        allowed_mentions: AllowedMentions = None,
+        components: List[Union[ActionRow, Component, List[Component]]] = None,
+    ) -> Union[ComponentMessage, dict]:
+        data = self._get_message_data(
+            content=content,
+            embed=embed,
+            embeds=embeds,
+            allowed_mentions=allowed_mentions,
+            components=components,
+        )
+        res = await self.client.http.edit_followup(
+            interaction_token=self.interaction_token,
+            message_id=getattr(message, "id", message),
+            data=data,
+            files=self._get_files(file, files),
+        )
+        return self._get_followup_message(res)
+
+    async def delete_followup(self, message: Union[ComponentMessage, int]) -> None:
+        await self.client.http.delete_followup(
+            interaction_token=self.interaction_token,
+            message_id=getattr(message, "id", message),
+        )
+
+    async def send_followups(self, *messages: dict) -> List[ComponentMessage]:
+        results = []
+        in_flight = None
+        for message in messages:
+            if in_flight is not None:
+                await sleep(0)
+            try:
+                data, files = self._get_followup_payload(**message)
+            except Exception:
+                if in_flight is not None:
+                    await in_flight
+                raise
+
+            if in_flight is not None:
+                results.append(self._get_followup_message(await in_flight))
+            in_flight = ensure_future(
+                self.client.http.send_followup(
+                    interaction_token=self.interaction_token, data=data, files=files
+                )
+            )
+
+        if in_flight is not None:
+            results.append(self._get_followup_message(await in_flight))
+        return results
+
+    def _get_followup_message(self, res) -> Union[ComponentMessage, dict]:
+        if not isinstance(res, dict):
+            return res
+
+        return ComponentMessage(
+            state=self.state,
+            data=res,
+            channel=self.channel or Object(id=self.channel_id),
+            ephemeral=res.get("flags") == 64,
+        )
+
     async def disable_components(self) -> None:
         await self.edit_origin(
             components=[row.disable_components() for row in self.message.components],
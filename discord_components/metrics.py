@@ -0,0 +1,155 @@
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from bisect import bisect_left
+from time import time
+
+from .interaction import INTERACTION_RESPONSE_TIMEOUT, _snowflake_timestamp
+
+
+__all__ = ("Metrics", "Histogram")
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: _Labels, extra: str = None) -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra is not None:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        res = []
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            res.append((bound, total))
+        return res
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": dict(self.cumulative()),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class Metrics:
+    def __init__(self, *, namespace: str = "discord_components", buckets=DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+
+        self._counters: Dict[str, Dict[_Labels, int]] = {}
+        self._histograms: Dict[str, Dict[_Labels, Histogram]] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self._counter_funcs: Dict[str, Callable[[], int]] = {}
+
+    def inc(self, name: str, value: int = 1, **labels: str):
+        series = self._counters.get(name)
+        if series is None:
+            series = self._counters[name] = {}
+
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str):
+        series = self._histograms.get(name)
+        if series is None:
+            series = self._histograms[name] = {}
+
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def gauge(self, name: str, func: Callable[[], float]):
+        self._gauges[name] = func
+
+    def counter(self, name: str, func: Callable[[], int]):
+        self._counter_funcs[name] = func
+
+    def observe_ack(self, interaction_id: int, response_type: int = None):
+        elapsed = time() - _snowflake_timestamp(interaction_id)
+        labels = {} if response_type is None else {"type": str(response_type)}
+
+        self.observe("first_ack_seconds", elapsed, **labels)
+        if elapsed > INTERACTION_RESPONSE_TIMEOUT:
+            self.inc("deadline_missed_total", **labels)
+
+    def reset(self):
+        self._counters.clear()
+        self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        return {
+            "counters": {
+                **{
+                    name: {labels: value for labels, value in series.items()}
+                    for name, series in self._counters.items()
+                },
+                **{name: {(): func()} for name, func in self._counter_funcs.items()},
+            },
+            "histograms": {
+                name: {labels: histogram.to_dict() for labels, histogram in series.items()}
+                for name, series in self._histograms.items()
+            },
+            "gauges": {name: func() for name, func in self._gauges.items()},
+        }
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for name, series in self._counters.items():
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {full_name} counter")
+            for labels, value in series.items():
+                lines.append(f"{full_name}{_format_labels(labels)} {value}")
+
+        for name, func in self._counter_funcs.items():
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {full_name} counter")
+            lines.append(f"{full_name} {_format_value(func())}")
+
+        for name, func in self._gauges.items():
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {full_name} gauge")
+            lines.append(f"{full_name} {_format_value(func())}")
+
+        for name, series in self._histograms.items():
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {full_name} histogram")
+            for labels, histogram in series.items():
+                for bound, count in histogram.cumulative():
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{full_name}_bucket{_format_labels(labels, le)} {count}")
+                lines.append(f"{full_name}_sum{_format_labels(labels)} {histogram.sum!r}")
+                lines.append(f"{full_name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
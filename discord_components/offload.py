@@ -0,0 +1,47 @@
+from typing import Callable, List, NamedTuple, Optional
+
+from asyncio import get_event_loop
+from concurrent.futures import Executor
+from functools import wraps
+
+from .interaction import Interaction
+
+
+__all__ = ("InteractionSnapshot",)
+
+
+class InteractionSnapshot(NamedTuple):
+    interaction_id: int
+    custom_id: str
+    values: List[str]
+    component_type: int
+    channel_id: int
+    guild_id: Optional[int]
+    message_id: int
+    user_id: int
+    components: List[dict]
+
+    @classmethod
+    def from_interaction(cls, interaction: Interaction) -> "InteractionSnapshot":
+        return cls(
+            interaction_id=interaction.interaction_id,
+            custom_id=interaction.custom_id,
+            values=list(interaction.values),
+            component_type=interaction.component_type,
+            channel_id=interaction.channel_id,
+            guild_id=interaction.guild_id,
+            message_id=interaction.message_id,
+            user_id=interaction.user_id,
+            components=interaction.raw_data["message"].get("components", []),
+        )
+
+
+def _offload_callback(callback: Callable, get_executor: Callable[[], Executor]):
+    @wraps(callback)
+    async def _callback(interaction: Interaction):
+        snapshot = InteractionSnapshot.from_interaction(interaction)
+        response = await get_event_loop().run_in_executor(get_executor(), callback, snapshot)
+        if response is not None:
+            await interaction.respond(**response)
+
+    return _callback
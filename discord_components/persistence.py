@@ -0,0 +1,121 @@
+from typing import Any, Callable, NamedTuple, Optional
+
+import sqlite3
+from asyncio import get_event_loop
+from concurrent.futures import Future, ThreadPoolExecutor
+from json import dumps, loads
+from threading import RLock
+from time import time
+
+
+__all__ = ("PersistentCallbackStore", "PersistentCallback")
+
+
+class PersistentCallback(NamedTuple):
+    custom_id: str
+    handler: str
+    args: dict
+    uses: Optional[int]
+    expires_at: Optional[float]
+
+
+class PersistentCallbackStore:
+    def __init__(self, path: str = "components.sqlite3"):
+        self.path = path
+
+        self._lock = RLock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS callbacks ("
+            "custom_id TEXT PRIMARY KEY, "
+            "handler TEXT NOT NULL, "
+            "args TEXT NOT NULL, "
+            "uses INTEGER, "
+            "expires_at REAL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS callbacks_expires_at ON callbacks (expires_at) "
+            "WHERE expires_at IS NOT NULL"
+        )
+        self._db.commit()
+        self._size = self._db.execute("SELECT COUNT(*) FROM callbacks").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        return await get_event_loop().run_in_executor(self._executor, func, *args)
+
+    def submit(self, func: Callable[..., Any], *args) -> Future:
+        return self._executor.submit(func, *args)
+
+    def add(
+        self,
+        custom_id: str,
+        handler: str,
+        args: dict = None,
+        *,
+        uses: int = None,
+        expires_at: float = None,
+    ):
+        with self._lock, self._db:
+            exists = self._db.execute(
+                "SELECT 1 FROM callbacks WHERE custom_id = ?", (custom_id,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO callbacks VALUES (?, ?, ?, ?, ?)",
+                (custom_id, handler, dumps(args or {}), uses, expires_at),
+            )
+            if exists is None:
+                self._size += 1
+
+    def get(self, custom_id: str) -> Optional[PersistentCallback]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT custom_id, handler, args, uses, expires_at FROM callbacks "
+                "WHERE custom_id = ?",
+                (custom_id,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = PersistentCallback(row[0], row[1], loads(row[2]), row[3], row[4])
+        if (entry.expires_at is not None and entry.expires_at <= time()) or (
+            entry.uses is not None and entry.uses <= 0
+        ):
+            self.remove(custom_id)
+            return None
+        return entry
+
+    def use(self, custom_id: str):
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE callbacks SET uses = uses - 1 WHERE custom_id = ? AND uses IS NOT NULL",
+                (custom_id,),
+            )
+            self._size -= self._db.execute(
+                "DELETE FROM callbacks WHERE custom_id = ? AND uses <= 0", (custom_id,)
+            ).rowcount
+
+    def remove(self, custom_id: str):
+        with self._lock, self._db:
+            self._size -= self._db.execute(
+                "DELETE FROM callbacks WHERE custom_id = ?", (custom_id,)
+            ).rowcount
+
+    def purge(self) -> int:
+        with self._lock, self._db:
+            count = self._db.execute(
+                "DELETE FROM callbacks WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time(),),
+            ).rowcount
+            self._size -= count
+            return count
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
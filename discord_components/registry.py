@@ -0,0 +1,188 @@
+from typing import Callable, Optional, Union
+
+from asyncio import TimerHandle, ensure_future, get_event_loop
+from collections import OrderedDict
+from datetime import datetime
+from heapq import heapify, heappush, heappop
+from inspect import isawaitable
+from time import time
+
+
+__all__ = ("CallbackRegistry", "EvictionReason")
+
+
+class EvictionReason:
+    expired = "expired"
+    evicted = "evicted"
+    exhausted = "exhausted"
+    removed = "removed"
+
+
+class CallbackRegistry:
+    def __init__(
+        self,
+        *,
+        max_size: int = None,
+        on_evict: Callable[[str, dict, str], None] = None,
+    ):
+        self.max_size = max_size
+        self.on_evict = on_evict
+
+        self._callbacks: "OrderedDict[str, dict]" = OrderedDict()
+        self._expiry = []
+        self._stale = 0
+        self._timer: Optional[TimerHandle] = None
+        self._timer_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def __contains__(self, custom_id: str) -> bool:
+        return self.get(custom_id) is not None
+
+    def __getitem__(self, custom_id: str) -> dict:
+        callback_info = self.get(custom_id)
+        if callback_info is None:
+            raise KeyError(custom_id)
+        return callback_info
+
+    def __delitem__(self, custom_id: str):
+        self._remove(custom_id, EvictionReason.removed)
+
+    def add(
+        self,
+        custom_id: str,
+        callback,
+        *,
+        uses: int = None,
+        filter=None,
+        timeout: float = None,
+        expires_at: Union[float, datetime] = None,
+    ) -> dict:
+        if isinstance(expires_at, datetime):
+            expires_at = expires_at.timestamp()
+        if timeout is not None:
+            expires_at = min(time() + timeout, expires_at or float("inf"))
+
+        callback_info = {
+            "callback": callback,
+            "uses": uses,
+            "filter": filter or (lambda x: True),
+            "expires_at": expires_at,
+        }
+
+        self.purge()
+        old_info = self._callbacks.pop(custom_id, None)
+        if old_info is not None and old_info["expires_at"] is not None:
+            self._stale += 1
+        self._callbacks[custom_id] = callback_info
+        if expires_at is not None:
+            heappush(self._expiry, (expires_at, custom_id))
+            self._compact()
+            self._arm()
+
+        if self.max_size is not None:
+            while len(self._callbacks) > self.max_size:
+                old_id, old_info = self._callbacks.popitem(last=False)
+                if old_info["expires_at"] is not None:
+                    self._stale += 1
+                self._evicted(old_id, old_info, EvictionReason.evicted)
+
+        return callback_info
+
+    def get(self, custom_id: str) -> Optional[dict]:
+        callback_info = self._callbacks.get(custom_id)
+        if callback_info is None:
+            return None
+
+        expires_at = callback_info["expires_at"]
+        if expires_at is not None and expires_at <= time():
+            self._remove(custom_id, EvictionReason.expired)
+            return None
+        if callback_info["uses"] is not None and callback_info["uses"] <= 0:
+            self._remove(custom_id, EvictionReason.exhausted)
+            return None
+
+        self._callbacks.move_to_end(custom_id)
+        return callback_info
+
+    def use(self, custom_id: str):
+        callback_info = self._callbacks.get(custom_id)
+        if callback_info is None or callback_info["uses"] is None:
+            return
+
+        callback_info["uses"] -= 1
+        if callback_info["uses"] <= 0:
+            self._remove(custom_id, EvictionReason.exhausted)
+
+    def remove(self, custom_id: str) -> Optional[dict]:
+        callback_info = self._remove(custom_id, EvictionReason.removed)
+        self._compact()
+        return callback_info
+
+    def purge(self) -> int:
+        now = time()
+        purged = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, custom_id = heappop(self._expiry)
+            callback_info = self._callbacks.get(custom_id)
+            if callback_info is not None and callback_info["expires_at"] == expires_at:
+                self._remove(custom_id, EvictionReason.expired)
+                purged += 1
+            self._stale = max(self._stale - 1, 0)
+        self._arm()
+        return purged
+
+    def clear(self):
+        self._callbacks.clear()
+        self._expiry.clear()
+        self._stale = 0
+        self._arm()
+
+    def _remove(self, custom_id: str, reason: str) -> Optional[dict]:
+        callback_info = self._callbacks.pop(custom_id, None)
+        if callback_info is not None:
+            if callback_info["expires_at"] is not None:
+                self._stale += 1
+            self._evicted(custom_id, callback_info, reason)
+        return callback_info
+
+    def _compact(self):
+        if self._stale < 64 or self._stale * 2 < len(self._expiry):
+            return
+
+        self._expiry = [
+            (callback_info["expires_at"], custom_id)
+            for custom_id, callback_info in self._callbacks.items()
+            if callback_info["expires_at"] is not None
+        ]
+        heapify(self._expiry)
+        self._stale = 0
+
+    def _arm(self):
+        if not self._expiry:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = self._timer_at = None
+            return
+
+        expires_at = self._expiry[0][0]
+        if self._timer is not None:
+            if self._timer_at <= expires_at:
+                return
+            self._timer.cancel()
+
+        self._timer_at = expires_at
+        self._timer = get_event_loop().call_later(max(expires_at - time(), 0), self._expire)
+
+    def _expire(self):
+        self._timer = self._timer_at = None
+        self.purge()
+
+    def _evicted(self, custom_id: str, callback_info: dict, reason: str):
+        if self.on_evict is None:
+            return
+
+        res = self.on_evict(custom_id, callback_info, reason)
+        if isawaitable(res):
+            ensure_future(res)
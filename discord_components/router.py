@@ -0,0 +1,159 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+import re
+
+
+__all__ = ("ComponentRouter", "route")
+
+
+_PARAM_RE = re.compile(r"{(\w+)(?::(\w+))?}")
+_CONVERTERS = {"str": str, "int": int}
+
+
+class _Route:
+    __slots__ = (
+        "pattern",
+        "callback",
+        "prefix",
+        "filter",
+        "regex",
+        "converters",
+        "specificity",
+    )
+
+    def __init__(self, pattern: str, callback, *, prefix: bool, filter):
+        self.pattern = pattern
+        self.callback = callback
+        self.prefix = prefix
+        self.filter = filter or (lambda x: True)
+        self.regex = None
+        self.converters = {}
+        self.specificity = (0, 0)
+
+        if prefix:
+            return
+
+        rest = pattern[_literal_prefix(pattern, prefix) :]
+        regex = ""
+        last = 0
+        for match in _PARAM_RE.finditer(rest):
+            name, converter = match.group(1), match.group(2) or "str"
+            if converter not in _CONVERTERS:
+                raise ValueError(f"Unknown converter {converter!r} in route {pattern!r}.")
+
+            regex += re.escape(rest[last : match.start()])
+            regex += f"(?P<{name}>-?\\d+)" if converter == "int" else f"(?P<{name}>[^:]+)"
+            self.converters[name] = _CONVERTERS[converter]
+            last = match.end()
+        regex += re.escape(rest[last:])
+        self.regex = re.compile(regex)
+        self.specificity = (
+            len(_PARAM_RE.sub("", rest)),
+            sum(converter is int for converter in self.converters.values()),
+        )
+
+    def match(self, rest: str) -> Optional[dict]:
+        if self.prefix:
+            return {}
+
+        match = self.regex.fullmatch(rest)
+        if match is None:
+            return None
+        return {
+            name: self.converters[name](value) for name, value in match.groupdict().items()
+        }
+
+
+class _RouteNode:
+    __slots__ = ("children", "routes")
+
+    def __init__(self):
+        self.children: Dict[str, "_RouteNode"] = {}
+        self.routes: List[_Route] = []
+
+
+def _literal_prefix(pattern: str, prefix: bool) -> int:
+    if prefix:
+        return len(pattern)
+
+    index = pattern.find("{")
+    return len(pattern) if index == -1 else index
+
+
+class ComponentRouter:
+    def __init__(self):
+        self._root = _RouteNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, callback, *, prefix: bool = False, filter=None):
+        route = _Route(pattern, callback, prefix=prefix, filter=filter)
+
+        node = self._root
+        for char in pattern[: _literal_prefix(pattern, prefix)]:
+            node = node.children.setdefault(char, _RouteNode())
+        node.routes.append(route)
+        node.routes.sort(key=lambda route: route.specificity, reverse=True)
+        self._size += 1
+
+    def remove(self, pattern: str, callback=None, *, prefix: bool = False):
+        path = [self._root]
+        for char in pattern[: _literal_prefix(pattern, prefix)]:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+
+        node = path[-1]
+        routes = [
+            route
+            for route in node.routes
+            if not (
+                route.pattern == pattern
+                and route.prefix == prefix
+                and (callback is None or route.callback == callback)
+            )
+        ]
+        self._size -= len(node.routes) - len(routes)
+        node.routes = routes
+
+        for char, parent in zip(reversed(pattern[: len(path) - 1]), reversed(path[:-1])):
+            child = parent.children[char]
+            if child.routes or child.children:
+                break
+            del parent.children[char]
+
+    def match(self, custom_id: str) -> Optional[Tuple[_Route, dict]]:
+        candidates = []
+        node = self._root
+        if node.routes:
+            candidates.append((0, node))
+        for depth, char in enumerate(custom_id, 1):
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.routes:
+                candidates.append((depth, node))
+
+        for depth, node in reversed(candidates):
+            rest = custom_id[depth:]
+            for route in node.routes:
+                params = route.match(rest)
+                if params is not None:
+                    return route, params
+
+    def clear(self):
+        self._root = _RouteNode()
+        self._size = 0
+
+
+def route(pattern: str, *, prefix: bool = False, filter=None) -> Callable:
+    def decorator(func):
+        routes = getattr(func, "__component_routes__", [])
+        routes.append((pattern, prefix, filter))
+        func.__component_routes__ = routes
+        return func
+
+    return decorator
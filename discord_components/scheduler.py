@@ -0,0 +1,66 @@
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+from asyncio import Lock, Semaphore, Task, ensure_future, wait
+
+
+__all__ = ("CallbackScheduler",)
+
+
+class CallbackScheduler:
+    def __init__(self, *, max_concurrency: int = None):
+        self.max_concurrency = max_concurrency
+        self.closed = False
+
+        self._semaphore: Optional[Semaphore] = None
+        self._locks: Dict[Hashable, List] = {}
+        self._tasks: Set[Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def schedule(
+        self, key: Optional[Hashable], func: Callable[..., Awaitable], *args, **kwargs
+    ) -> Optional[Task]:
+        if self.closed:
+            return None
+
+        if self._semaphore is None and self.max_concurrency is not None:
+            self._semaphore = Semaphore(self.max_concurrency)
+
+        task = ensure_future(self._run(key, func, args, kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def drain(self, timeout: float = None) -> int:
+        self.closed = True
+        if not self._tasks:
+            return 0
+
+        _, pending = await wait(set(self._tasks), timeout=timeout)
+        return len(pending)
+
+    async def _run(self, key: Optional[Hashable], func: Callable[..., Awaitable], args, kwargs):
+        if key is None:
+            return await self._call(func, args, kwargs)
+
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [Lock(), 0]
+        entry[1] += 1
+
+        try:
+            async with entry[0]:
+                return await self._call(func, args, kwargs)
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+
+    async def _call(self, func: Callable[..., Awaitable], args, kwargs):
+        if self._semaphore is None:
+            return await func(*args, **kwargs)
+
+        async with self._semaphore:
+            return await func(*args, **kwargs)
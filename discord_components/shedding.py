@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional
+
+from asyncio import TimerHandle, get_event_loop
+
+from .encoder import RawJSON, get_json_encoder
+
+
+__all__ = ("LoadShedder", "ShedAction")
+
+
+class ShedAction:
+    respond = "respond"
+    drop = "drop"
+
+
+class _Threshold:
+    __slots__ = ("prefix", "max_backlog", "max_lag", "action")
+
+    def __init__(self, prefix: str, max_backlog: int, max_lag: float, action: str):
+        self.prefix = prefix
+        self.max_backlog = max_backlog
+        self.max_lag = max_lag
+        self.action = action
+
+
+class LoadShedder:
+    def __init__(
+        self,
+        *,
+        max_backlog: int = None,
+        max_lag: float = None,
+        action: str = ShedAction.respond,
+        message: str = "The bot is busy right now, please try again in a moment.",
+        probe_interval: float = 0.25,
+    ):
+        if action not in (ShedAction.respond, ShedAction.drop):
+            raise ValueError('action must be "respond" or "drop".')
+
+        self.probe_interval = probe_interval
+        self.response = RawJSON(get_json_encoder()({"content": message, "flags": 64}))
+
+        self.shed = 0
+        self.responded = 0
+        self.dropped = 0
+        self.shed_by_prefix: Dict[str, int] = {}
+
+        self._thresholds: Dict[str, _Threshold] = {}
+        self._prefixes: List[str] = []
+        self.set_threshold("", max_backlog=max_backlog, max_lag=max_lag, action=action)
+
+        self._lag = 0.0
+        self._expected: Optional[float] = None
+        self._probe: Optional[TimerHandle] = None
+
+    def set_threshold(
+        self, prefix: str, *, max_backlog: int = None, max_lag: float = None, action: str = None
+    ):
+        if action is None:
+            action = self._thresholds[""].action if "" in self._thresholds else ShedAction.respond
+        if action not in (ShedAction.respond, ShedAction.drop):
+            raise ValueError('action must be "respond" or "drop".')
+
+        self._thresholds[prefix] = _Threshold(prefix, max_backlog, max_lag, action)
+        self._prefixes = sorted(self._thresholds, key=len, reverse=True)
+
+    def remove_threshold(self, prefix: str):
+        if not prefix:
+            raise ValueError("The default threshold cannot be removed.")
+        if self._thresholds.pop(prefix, None) is not None:
+            self._prefixes.remove(prefix)
+
+    @property
+    def lag(self) -> float:
+        if self._expected is None:
+            return 0.0
+        return max(self._lag, get_event_loop().time() - self._expected)
+
+    def check(self, custom_id: str, backlog: int) -> Optional[str]:
+        if self._probe is None:
+            self.start()
+
+        for prefix in self._prefixes:
+            if custom_id.startswith(prefix):
+                threshold = self._thresholds[prefix]
+                break
+
+        overloaded = (
+            threshold.max_backlog is not None and backlog >= threshold.max_backlog
+        ) or (threshold.max_lag is not None and self.lag >= threshold.max_lag)
+        if not overloaded:
+            return None
+
+        self.shed += 1
+        self.shed_by_prefix[threshold.prefix] = self.shed_by_prefix.get(threshold.prefix, 0) + 1
+        if threshold.action == ShedAction.respond:
+            self.responded += 1
+        else:
+            self.dropped += 1
+        return threshold.action
+
+    def start(self):
+        if self._probe is not None:
+            return
+
+        loop = get_event_loop()
+        self._expected = loop.time() + self.probe_interval
+        self._probe = loop.call_later(self.probe_interval, self._tick)
+
+    def stop(self):
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        self._expected = None
+        self._lag = 0.0
+
+    def _tick(self):
+        loop = get_event_loop()
+        now = loop.time()
+        self._lag = max(now - self._expected, 0.0)
+        self._expected = now + self.probe_interval
+        self._probe = loop.call_later(self.probe_interval, self._tick)
@@ -0,0 +1,108 @@
+from typing import Any, List, Union
+
+from discord import InvalidArgument
+
+import json
+import re
+
+from .component import ActionRow, Button, ButtonStyle, Component, Select
+from .encoder import RawJSON, get_json_encoder
+
+
+__all__ = ("Slot", "ComponentTemplate")
+
+
+_SLOT_RE = re.compile(rb'"\\u0000(\w+)\\u0000"')
+
+
+class Slot:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<Slot name={self.name!r}>"
+
+    def __bool__(self) -> bool:
+        return True
+
+
+def _encode_slot(obj: Any) -> str:
+    if isinstance(obj, Slot):
+        return f"\0{obj.name}\0"
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+class ComponentTemplate:
+    __slots__ = ("_segments", "_slots", "_rendered")
+
+    def __init__(self, components: List[Union[ActionRow, Component, List[Component]]]):
+        rows = []
+        for row in components:
+            if isinstance(row, list):
+                row = ActionRow(*row)
+            elif not isinstance(row, ActionRow):
+                row = ActionRow(row)
+            rows.append(row)
+
+        self._validate(rows)
+
+        encoded = json.dumps(
+            [row.to_dict() for row in rows],
+            default=_encode_slot,
+            separators=(",", ":"),
+            ensure_ascii=True,
+        ).encode("utf-8")
+
+        parts = _SLOT_RE.split(encoded)
+        self._segments: List[bytes] = parts[::2]
+        self._slots: List[str] = [name.decode("utf-8") for name in parts[1::2]]
+        self._rendered = RawJSON(encoded) if not self._slots else None
+
+    @property
+    def slots(self) -> List[str]:
+        return list(self._slots)
+
+    def render(self, **values) -> RawJSON:
+        if self._rendered is not None:
+            return self._rendered
+
+        dumps = get_json_encoder()
+        segments = self._segments
+        body = [segments[0]]
+        for i, name in enumerate(self._slots, 1):
+            try:
+                body.append(dumps(values[name]))
+            except KeyError:
+                raise InvalidArgument(f"Missing value for slot {name!r}.") from None
+            body.append(segments[i])
+        return RawJSON(b"".join(body))
+
+    @staticmethod
+    def _validate(rows: List[ActionRow]):
+        if len(rows) > 5:
+            raise InvalidArgument("A message can have up to 5 action rows.")
+
+        custom_ids = set()
+        for row in rows:
+            if not len(row) or len(row) > 5:
+                raise InvalidArgument("Action rows should have between 1 and 5 components.")
+            if len(row) > 1 and any(isinstance(component, Select) for component in row):
+                raise InvalidArgument("A select must be the only component of its action row.")
+
+            for component in row:
+                if isinstance(component, Button) and isinstance(component.label, str):
+                    if len(component.label) > 80:
+                        raise InvalidArgument("Button labels can have up to 80 characters.")
+                if isinstance(component, Button) and component.style == ButtonStyle.URL:
+                    continue
+
+                custom_id = component.custom_id
+                if isinstance(custom_id, Slot):
+                    continue
+                if len(custom_id) > 100:
+                    raise InvalidArgument("Custom ids can have up to 100 characters.")
+                if custom_id in custom_ids:
+                    raise InvalidArgument(f"Duplicate custom id {custom_id!r}.")
+                custom_ids.add(custom_id)
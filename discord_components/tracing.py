@@ -0,0 +1,68 @@
+from typing import Any, Callable, ContextManager, Dict, Optional
+
+from random import random
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    ContextVar = None
+
+
+__all__ = ("Tracer",)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_sampled = ContextVar("discord_components_sampled", default=False) if ContextVar else None
+
+
+class Tracer:
+    def __init__(
+        self,
+        tracer: Any,
+        *,
+        sample_rate: float = 1.0,
+    ):
+        if _sampled is None:
+            raise RuntimeError("Tracing requires Python 3.7 or newer.")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1.")
+
+        if hasattr(tracer, "start_as_current_span"):
+            self._start: Callable[[str, Dict[str, Any]], ContextManager] = (
+                lambda name, attributes: tracer.start_as_current_span(name, attributes=attributes)
+            )
+        elif callable(tracer):
+            self._start = tracer
+        else:
+            raise TypeError("tracer must have start_as_current_span or be callable.")
+
+        self.tracer = tracer
+        self.sample_rate = sample_rate
+
+    def sample(self) -> bool:
+        sampled = self.sample_rate >= 1 or random() < self.sample_rate
+        _sampled.set(sampled)
+        return sampled
+
+    def span(self, name: str, attributes: Dict[str, Any] = None) -> ContextManager:
+        if not _sampled.get():
+            return _NULL_SPAN
+        if attributes:
+            attributes = {key: value for key, value in attributes.items() if value is not None}
+        return self._start(name, attributes or {})
+
+
+def _span(tracer: Optional[Tracer], name: str, attributes: Dict[str, Any] = None):
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, attributes)
@@ -2,10 +2,15 @@ from typing import List, Union, Optional
 
 from discord import File
 
-from aiohttp import FormData
-from json import dumps
+from aiohttp import MultipartWriter
+from aiohttp.payload import Payload
+from io import SEEK_END, UnsupportedOperation
+from mmap import mmap, ACCESS_READ
 
 from .component import ActionRow, Component
+from .file import StreamingFile
+from .encoder import _json_payload, RawJSON
+from .template import ComponentTemplate
 
 
 __all__ = ("_get_components_json",)
@@ -13,9 +18,13 @@ __all__ = ("_get_components_json",)
 
 def _get_components_json(
     components: List[Union[ActionRow, Component, List[Component]]] = None
-) -> Optional[List[dict]]:
+) -> Optional[Union[List[dict], RawJSON]]:
     if components is None:
         return None
+    if isinstance(components, RawJSON):
+        return components
+    if isinstance(components, ComponentTemplate):
+        return components.render()
 
     for i in range(len(components)):
         if isinstance(components[i], list):
@@ -27,26 +36,98 @@ def _get_components_json(
     return [row.to_dict() for row in lines] if lines else []
 
 
+class _FilePayload(Payload):
+    _chunk_size = 2 ** 16
+
+    def __init__(self, file: File):
+        super().__init__(file, content_type="application/octet-stream", filename=file.filename)
+        self._start = 0
+        self._fileno = None
+        self._seekable = False
+
+        if isinstance(file, StreamingFile):
+            self._size = file.size
+            return
+
+        fp = file.fp
+        try:
+            self._start = getattr(file, "_original_pos", None)
+            if self._start is None:
+                self._start = fp.tell()
+            end = fp.seek(0, SEEK_END)
+            fp.seek(self._start)
+        except (AttributeError, OSError, UnsupportedOperation, ValueError):
+            self._start = 0
+            self._size = None
+            return
+
+        self._seekable = True
+        self._size = end - self._start
+        try:
+            self._fileno = fp.fileno()
+        except (AttributeError, OSError, UnsupportedOperation, ValueError):
+            pass
+
+    async def write(self, writer) -> None:
+        file = self._value
+        if isinstance(file, StreamingFile):
+            async for chunk in file.source():
+                await writer.write(chunk)
+            return
+
+        mapped = None
+        if self._fileno is not None and self._size:
+            try:
+                mapped = mmap(self._fileno, 0, access=ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+
+        if mapped is not None:
+            try:
+                for i in range(self._start, len(mapped), self._chunk_size):
+                    await writer.write(mapped[i : i + self._chunk_size])
+            finally:
+                mapped.close()
+            return
+
+        if self._seekable:
+            file.fp.seek(self._start)
+        chunk = file.fp.read(self._chunk_size)
+        while chunk:
+            await writer.write(chunk)
+            chunk = file.fp.read(self._chunk_size)
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        if isinstance(self._value, StreamingFile):
+            raise TypeError("Streaming file payloads cannot be decoded synchronously.")
+        if not self._seekable:
+            raise TypeError("Non-seekable file payloads cannot be decoded without consuming them.")
+
+        self._value.fp.seek(self._start)
+        return self._value.fp.read().decode(encoding, errors)
+
+
 def _form_files(
     data: dict, files: List[File] = None, use_form: bool = True
-) -> Union[FormData, List[dict]]:
+) -> Union[MultipartWriter, List[dict]]:
     if use_form:
-        form = FormData()
-        form.add_field("payload_json", dumps(data))
+        form = MultipartWriter("form-data")
+        payload = form.append_payload(_json_payload(data))
+        payload.set_content_disposition("form-data", name="payload_json")
         for i in range(len(files)):
-            form.add_field(
-                f"file{i if len(files) > 1 else ''}",
-                files[i].fp,
-                filename=files[i].filename,
-                content_type="application/octet-stream",
-            )
+            params = {"name": f"file{i if len(files) > 1 else ''}"}
+            if files[i].filename is not None:
+                params["filename"] = files[i].filename
+
+            payload = form.append_payload(_FilePayload(files[i]))
+            payload.set_content_disposition("form-data", **params)
     else:
-        form = [{"name": "payload_json", "value": dumps(data)}]
+        form = [{"name": "payload_json", "value": _json_payload(data)}]
         for i in range(len(files)):
             form.append(
                 {
                     "name": f"file{i if len(files) > 1 else ''}",
-                    "value": files[i].fp,
+                    "value": _FilePayload(files[i]),
                     "filename": files[i].filename,
                     "content_type": "application/octet-stream",
                 }
@@ -0,0 +1,105 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from asyncio import Future, get_event_loop
+from itertools import product
+
+
+__all__ = ("WaiterTable",)
+
+
+WaiterKey = Tuple[Optional[int], Optional[str], Optional[int]]
+
+
+class _Waiter:
+    __slots__ = ("event", "key", "check", "future")
+
+    def __init__(self, event: str, key: WaiterKey, check: Callable, future: Future):
+        self.event = event
+        self.key = key
+        self.check = check
+        self.future = future
+
+
+class WaiterTable:
+    def __init__(self):
+        self._indexed: Dict[WaiterKey, List[_Waiter]] = {}
+        self._unindexed: List[_Waiter] = []
+
+    def __len__(self) -> int:
+        return sum(map(len, self._indexed.values())) + len(self._unindexed)
+
+    def add(
+        self,
+        event: str,
+        *,
+        message_id: int = None,
+        custom_id: str = None,
+        user_id: int = None,
+        check: Callable = None,
+    ) -> _Waiter:
+        key = (message_id, custom_id, user_id)
+        waiter = _Waiter(event, key, check, get_event_loop().create_future())
+        if key == (None, None, None):
+            self._unindexed.append(waiter)
+        else:
+            self._indexed.setdefault(key, []).append(waiter)
+        return waiter
+
+    def remove(self, waiter: _Waiter):
+        if waiter.key == (None, None, None):
+            waiters = self._unindexed
+        else:
+            waiters = self._indexed.get(waiter.key)
+            if waiters is None:
+                return
+
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+
+        if not waiters and waiters is not self._unindexed:
+            del self._indexed[waiter.key]
+
+    def resolve(self, event: str, interaction) -> int:
+        resolved = 0
+        if self._indexed:
+            keys = product(
+                (interaction.message_id, None),
+                (interaction.custom_id, None),
+                (interaction.user_id, None),
+            )
+            for key in keys:
+                waiters = self._indexed.get(key)
+                if waiters:
+                    resolved += self._resolve(event, interaction, waiters)
+                    if not waiters:
+                        del self._indexed[key]
+
+        if self._unindexed:
+            resolved += self._resolve(event, interaction, self._unindexed)
+        return resolved
+
+    @staticmethod
+    def _resolve(event: str, interaction, waiters: List[_Waiter]) -> int:
+        done = []
+        for waiter in waiters:
+            if waiter.event != event:
+                continue
+
+            if waiter.future.done():
+                done.append(waiter)
+                continue
+
+            try:
+                if waiter.check is not None and not waiter.check(interaction):
+                    continue
+            except Exception as e:
+                waiter.future.set_exception(e)
+            else:
+                waiter.future.set_result(interaction)
+            done.append(waiter)
+
+        for waiter in done:
+            waiters.remove(waiter)
+        return len(done)
@@ -0,0 +1,33 @@
+from discord.ext.commands import command, Cog
+from discord_components import Button, ButtonStyle, route
+
+
+class ShopCog(Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.bot.components_manager.add_routes(self)
+
+    def cog_unload(self):
+        self.bot.components_manager.remove_routes(self)
+
+    @command()
+    async def shop(self, ctx):
+        await ctx.send(
+            "Shop!",
+            components=[
+                Button(
+                    style=ButtonStyle.green,
+                    label=f"Buy item {item_id}",
+                    custom_id=f"shop:buy:{item_id}",
+                )
+                for item_id in range(5)
+            ],
+        )
+
+    @route("shop:buy:{item_id:int}")
+    async def buy(self, interaction, item_id: int):
+        await interaction.send(content=f"You bought item {item_id}!")
+
+
+def setup(bot):
+    bot.add_cog(ShopCog(bot))
@@ -26,6 +26,7 @@ except KeyError:
 extras = {
     "lint": ["black", "flake8", "isort"],
     "readthedocs": ["sphinx", "sphinx-rtd-theme"],
+    "speed": ["orjson"],
 }
 extras["lint"] += extras["readthedocs"]
 extras["dev"] = extras["lint"] + extras["readthedocs"]